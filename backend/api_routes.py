@@ -1,11 +1,23 @@
 from __future__ import annotations
 
+import io
 import logging
+import time
 from datetime import datetime, UTC
 from typing import Dict, List, Optional
 
-from fastapi import APIRouter, HTTPException, Request, UploadFile, File, status
-from pydantic import BaseModel, Field
+import orjson
+from fastapi import (
+    APIRouter,
+    HTTPException,
+    Request,
+    Response,
+    UploadFile,
+    File,
+    status,
+)
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel, Field, TypeAdapter
 
 from core.models import (
     Account,
@@ -24,13 +36,18 @@ from core.models import (
     OwnerCreate,
 )
 from services import dynamo_expenses as db
-from services.csv_service import validate_csv_file
+from services.csv_service import validate_csv_stream
 from services.reports_service import ReportsService
 from services.upload_service import UploadProcessingService
 
 logger = logging.getLogger("expense_tracker.api")
 router = APIRouter()
 
+# Health probes are frequent; serve a pre-encoded body refreshed at this interval
+HEALTH_CACHE_TTL_SECONDS = 1.0
+
+_expense_list_adapter = TypeAdapter(List[Expense])
+
 
 class HealthResponse(BaseModel):
     status: str
@@ -47,56 +64,80 @@ class UploadResponse(BaseModel):
     errors: List[str] = Field(default_factory=list)
     auto_categorized_count: int = 0
     needs_review_count: int = 0
+    duplicate_count: int = 0
+
+
+def _expense_list_response(expenses: List[Expense]) -> Response:
+    """Serialize an expense list straight to JSON, skipping response re-validation."""
+    return Response(
+        _expense_list_adapter.dump_json(expenses), media_type="application/json"
+    )
 
 
 @router.get("/health", response_model=HealthResponse)
-async def health_check(request: Request) -> HealthResponse:
+async def health_check(request: Request) -> Response:
     """Health check endpoint for monitoring and validation."""
-    logger.info("Health check endpoint called")
+    state = request.app.state
+    now = time.monotonic()
+    cached_at, body = getattr(state, "health_cache", (0.0, b""))
 
-    config = getattr(request.app.state, "config", None)
-    environment = getattr(config, "environment", None) if config else None
-    version = getattr(config, "version", "1.0.0")
+    if not body or now - cached_at >= HEALTH_CACHE_TTL_SECONDS:
+        logger.info("Health check endpoint called")
 
-    return HealthResponse(
-        status="healthy",
-        timestamp=datetime.now(UTC).isoformat(),
-        version=version,
-        environment=environment,
-    )
+        config = getattr(state, "config", None)
+        environment = getattr(config, "environment", None) if config else None
+        version = getattr(config, "version", "1.0.0")
+
+        body = HealthResponse(
+            status="healthy",
+            timestamp=datetime.now(UTC).isoformat(),
+            version=version,
+            environment=environment,
+        ).model_dump_json()
+        state.health_cache = (now, body)
+
+    return Response(body, media_type="application/json")
 
 
 @router.get("/")
-async def root(request: Request) -> Dict[str, str]:
+async def root(request: Request) -> Response:
     """Root endpoint providing service metadata."""
-    config = getattr(request.app.state, "config", None)
+    state = request.app.state
+    body = getattr(state, "root_body", None)
 
-    message = getattr(config, "root_message", "Expense Tracker API")
-    version = getattr(config, "version", "1.0.0")
+    # The payload only depends on the app config, so encode it once per app
+    if body is None:
+        config = getattr(state, "config", None)
 
-    response: Dict[str, str] = {"message": message, "version": version}
+        message = getattr(config, "root_message", "Expense Tracker API")
+        version = getattr(config, "version", "1.0.0")
 
-    if config and getattr(config, "environment", None):
-        response["environment"] = config.environment
+        response: Dict[str, str] = {"message": message, "version": version}
 
-    return response
+        if config and getattr(config, "environment", None):
+            response["environment"] = config.environment
+
+        body = orjson.dumps(response)
+        state.root_body = body
+
+    return Response(body, media_type="application/json")
 
 
 # Owner Management Endpoints (S1.1)
 @router.post("/owners", response_model=Owner, status_code=status.HTTP_201_CREATED)
-async def create_owner(owner_data: OwnerCreate) -> Owner:
+def create_owner(owner_data: OwnerCreate) -> Owner:
     """Create a new owner (immutable entity)."""
     return db.create_owner(owner_data)
 
 
 @router.get("/owners", response_model=List[Owner])
-async def list_owners() -> List[Owner]:
+def list_owners() -> List[Owner]:
     """List all owners."""
     return db.list_owners()
 
 
 @router.get("/owners/{name}", response_model=Owner)
-async def get_owner(name: str) -> Owner:
+def get_owner(name: str) -> Owner:
     """Get owner by name."""
     owner = db.get_owner(name)
     if not owner:
@@ -109,19 +150,19 @@ async def get_owner(name: str) -> Owner:
 
 # Account Management Endpoints (S1.2)
 @router.post("/accounts", response_model=Account, status_code=status.HTTP_201_CREATED)
-async def create_account(account_data: AccountCreate) -> Account:
+def create_account(account_data: AccountCreate) -> Account:
     """Create a new account."""
     return db.create_account(account_data)
 
 
 @router.get("/accounts", response_model=List[Account])
-async def list_accounts(owner_name: str = None) -> List[Account]:
+def list_accounts(owner_name: str = None) -> List[Account]:
     """List all accounts, optionally filtered by owner."""
     return db.list_accounts(owner_name=owner_name)
 
 
 @router.get("/accounts/{account_id}", response_model=Account)
-async def get_account(account_id: str) -> Account:
+def get_account(account_id: str) -> Account:
     """Get account by account_id (account_name + space + owner_name)."""
     account = db.get_account(account_id)
     if not account:
@@ -133,7 +174,7 @@ async def get_account(account_id: str) -> Account:
 
 
 @router.patch("/accounts/{account_id}/deactivate", response_model=Account)
-async def deactivate_account(account_id: str) -> Account:
+def deactivate_account(account_id: str) -> Account:
     """Deactivate an account."""
     update_data = AccountUpdate(active=False)
     account = db.update_account(account_id, update_data)
@@ -149,19 +190,19 @@ async def deactivate_account(account_id: str) -> Account:
 @router.post(
     "/categories", response_model=Category, status_code=status.HTTP_201_CREATED
 )
-async def create_category(category_data: CategoryCreate) -> Category:
+def create_category(category_data: CategoryCreate) -> Category:
     """Create a new category."""
     return db.create_category(category_data)
 
 
 @router.get("/categories", response_model=List[Category])
-async def list_categories(account_id: str = None) -> List[Category]:
+def list_categories(account_id: str = None) -> List[Category]:
     """List all categories, optionally filtered by account."""
     return db.list_categories(account_id=account_id)
 
 
 @router.get("/categories/{name}", response_model=Category)
-async def get_category(name: str) -> Category:
+def get_category(name: str) -> Category:
     """Get category by name."""
     category = db.get_category(name)
     if not category:
@@ -173,7 +214,7 @@ async def get_category(name: str) -> Category:
 
 
 @router.patch("/categories/{name}/deactivate", response_model=Category)
-async def deactivate_category(name: str) -> Category:
+def deactivate_category(name: str) -> Category:
     """Deactivate a category."""
     update_data = CategoryUpdate(active=False)
     category = db.update_category(name, update_data)
@@ -186,7 +227,7 @@ async def deactivate_category(name: str) -> Category:
 
 
 @router.patch("/categories/{name}/labels", response_model=Category)
-async def update_category_labels(name: str, update_data: CategoryUpdate) -> Category:
+def update_category_labels(name: str, update_data: CategoryUpdate) -> Category:
     """Update category labels."""
     category = db.update_category(name, update_data)
     if not category:
@@ -199,20 +240,20 @@ async def update_category_labels(name: str, update_data: CategoryUpdate) -> Cate
 
 # Expense Management Endpoints (S1.4)
 @router.post("/expenses", response_model=Expense, status_code=status.HTTP_201_CREATED)
-async def create_expense(expense_data: ExpenseCreate) -> Expense:
+def create_expense(expense_data: ExpenseCreate) -> Expense:
     """Create a new expense."""
     return db.create_expense(expense_data)
 
 
 @router.get("/expenses", response_model=List[Expense])
-async def list_expenses(
+def list_expenses(
     start_date: datetime = None,
     end_date: datetime = None,
     account_id: str = None,
     category: str = None,
     assigned_card_member: str = None,
     needs_review: bool = None,
-) -> List[Expense]:
+) -> Response:
     """List expenses with optional filtering."""
     expense_filter = ExpenseFilter(
         start_date=start_date,
@@ -222,11 +263,11 @@ async def list_expenses(
         assigned_card_member=assigned_card_member,
         needs_review=needs_review,
     )
-    return db.list_expenses(expense_filter)
+    return _expense_list_response(db.list_expenses(expense_filter))
 
 
 @router.get("/expenses/search", response_model=List[Expense])
-async def search_expenses(prefix: str) -> List[Expense]:
+def search_expenses(prefix: str) -> Response:
     """Search expenses by expense_id prefix."""
     if not prefix or len(prefix) < 3:
         raise HTTPException(
@@ -235,11 +276,11 @@ async def search_expenses(prefix: str) -> List[Expense]:
         )
 
     expenses = db.search_expenses_by_id_prefix(prefix)
-    return expenses
+    return _expense_list_response(expenses)
 
 
 @router.get("/expenses/{expense_id}", response_model=Expense)
-async def get_expense(expense_id: str) -> Expense:
+def get_expense(expense_id: str) -> Expense:
     """Get expense by ID."""
     expense = db.get_expense(expense_id)
     if not expense:
@@ -251,7 +292,7 @@ async def get_expense(expense_id: str) -> Expense:
 
 
 @router.patch("/expenses/{expense_id}", response_model=Expense)
-async def update_expense(expense_id: str, update_data: ExpenseUpdate) -> Expense:
+def update_expense(expense_id: str, update_data: ExpenseUpdate) -> Expense:
     """Update expense (assigned_card_member and category only)."""
     expense = db.update_expense(expense_id, update_data)
     if not expense:
@@ -263,7 +304,7 @@ async def update_expense(expense_id: str, update_data: ExpenseUpdate) -> Expense
 
 
 @router.patch("/expenses/{expense_id}/assigned-card-member", response_model=Expense)
-async def update_expense_assigned_card_member(
+def update_expense_assigned_card_member(
     expense_id: str, update_data: ExpenseAssignedCardMemberUpdate
 ) -> Expense:
     """Update expense assigned_card_member field."""
@@ -280,7 +321,7 @@ async def update_expense_assigned_card_member(
 
 
 @router.delete("/expenses/{expense_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_expense(expense_id: str):
+def delete_expense(expense_id: str):
     """Delete expense by ID."""
     deleted = db.delete_expense(expense_id)
     if not deleted:
@@ -300,11 +341,8 @@ async def upload_csv_expenses(file: UploadFile = File(...)) -> UploadResponse:
             detail="File must be a CSV file",
         )
 
-    # Read file content
-    file_content = await file.read()
-
-    # Validate file size and format
-    validation_errors = validate_csv_file(file_content)
+    # Validate file size and format straight from the spooled upload
+    validation_errors = await run_in_threadpool(validate_csv_stream, file.file)
     if validation_errors:
         return UploadResponse(
             success=False,
@@ -316,15 +354,21 @@ async def upload_csv_expenses(file: UploadFile = File(...)) -> UploadResponse:
             needs_review_count=0,
         )
 
-    # Delegate processing to service
-    csv_text = file_content.decode("utf-8")
+    # Delegate processing to service, decoding the upload as it is parsed
+    csv_stream = io.TextIOWrapper(file.file, encoding="utf-8", newline="")
     processor = UploadProcessingService()
-    (
-        processed_count,
-        auto_categorized_count,
-        needs_review_count,
-        all_errors,
-    ) = processor.process_csv_text(csv_text)
+    try:
+        # Processing issues blocking DynamoDB calls; keep them off the event loop
+        (
+            processed_count,
+            auto_categorized_count,
+            needs_review_count,
+            duplicate_count,
+            all_errors,
+        ) = await run_in_threadpool(processor.process_csv_stream, csv_stream)
+    finally:
+        # Leave the underlying file for UploadFile to close
+        csv_stream.detach()
     total_errors = len(all_errors)
 
     success = total_errors == 0 and processed_count > 0
@@ -333,6 +377,8 @@ async def upload_csv_expenses(file: UploadFile = File(...)) -> UploadResponse:
         message += f", {auto_categorized_count} auto-categorized"
     if needs_review_count > 0:
         message += f", {needs_review_count} need review"
+    if duplicate_count > 0:
+        message += f", {duplicate_count} duplicates skipped"
     if total_errors > 0:
         message += f", {total_errors} errors"
 
@@ -344,12 +390,13 @@ async def upload_csv_expenses(file: UploadFile = File(...)) -> UploadResponse:
         errors=all_errors[:10],  # Limit to first 10 errors for response size
         auto_categorized_count=auto_categorized_count,
         needs_review_count=needs_review_count,
+        duplicate_count=duplicate_count,
     )
 
 
 # Reports endpoints
 @router.get("/reports/expenses-by-account", response_model=ExpensesByAccountReport)
-async def get_expenses_by_account_report(
+def get_expenses_by_account_report(
     start_date: str = None,
     end_date: str = None,
     category: str = None,
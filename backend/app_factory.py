@@ -3,12 +3,13 @@ from __future__ import annotations
 import logging
 import os
 import sys
+import time
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from datetime import datetime, UTC
 from typing import Optional
 
 from fastapi import FastAPI, Request
+from fastapi.responses import ORJSONResponse
 
 from api_routes import router
 from core.database import initialize_database
@@ -17,6 +18,12 @@ from core.error_handlers import (
     runtime_error_handler,
     generic_exception_handler,
 )
+from services.csv_service import MAX_CSV_SIZE_KB
+
+# Upload request bodies may exceed the CSV limit by this much multipart framing
+UPLOAD_BODY_OVERHEAD_BYTES = 16 * 1024
+MAX_UPLOAD_BODY_BYTES = MAX_CSV_SIZE_KB * 1024 + UPLOAD_BODY_OVERHEAD_BYTES
+UPLOAD_PATH = "/expenses/upload"
 
 
 @dataclass
@@ -76,6 +83,7 @@ def create_app(config: AppConfig) -> FastAPI:
         description=config.description,
         version=config.version,
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     app.state.config = config
@@ -85,15 +93,34 @@ def create_app(config: AppConfig) -> FastAPI:
     app.add_exception_handler(RuntimeError, runtime_error_handler)
     app.add_exception_handler(Exception, generic_exception_handler)
 
+    @app.middleware("http")
+    async def limit_upload_size(request: Request, call_next):
+        """Reject oversized uploads from Content-Length before the body is read."""
+        if request.url.path == UPLOAD_PATH:
+            content_length = request.headers.get("content-length")
+            if (
+                content_length
+                and content_length.isdigit()
+                and int(content_length) > MAX_UPLOAD_BODY_BYTES
+            ):
+                return ORJSONResponse(
+                    status_code=413,
+                    content={"detail": f"CSV file too large (max {MAX_CSV_SIZE_KB}KB)"},
+                )
+        return await call_next(request)
+
     @app.middleware("http")
     async def log_requests(request: Request, call_next):
         """Log every incoming request and its response time."""
-        start_time = datetime.now(UTC)
+        if not logger.isEnabledFor(logging.INFO):
+            return await call_next(request)
+
+        start_time = time.perf_counter()
         logger.info("Request: %s %s", request.method, request.url)
 
         response = await call_next(request)
 
-        process_time = (datetime.now(UTC) - start_time).total_seconds()
+        process_time = time.perf_counter() - start_time
         logger.info("Response: %s - %.3fs", response.status_code, process_time)
 
         return response
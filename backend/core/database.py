@@ -1,14 +1,19 @@
 import logging
 import os
+from bisect import bisect_left, bisect_right, insort
+from functools import lru_cache
+from operator import itemgetter
 from typing import Any, Dict, List, Optional, Tuple
 
 # Optional AWS SDK imports: provide fallbacks for local/tests where boto3 isn't installed
 try:  # pragma: no cover - exercised implicitly via environment
     import boto3  # type: ignore
     from boto3.dynamodb.conditions import ConditionBase  # type: ignore
+    from botocore.config import Config  # type: ignore
     from botocore.exceptions import ClientError  # type: ignore
 except Exception:  # pragma: no cover - fallback for test environment without boto3
     boto3 = None  # type: ignore
+    Config = None  # type: ignore
 
     class ClientError(Exception):  # minimal compatible stub
         def __init__(self, response: Dict[str, Any], operation_name: str):
@@ -24,6 +29,24 @@ logger = logging.getLogger(__name__)
 
 IN_MEMORY_TABLES: Dict[str, "InMemoryDynamoTable"] = {}
 
+# Connection pool sized for the threadpool that serves sync endpoints
+MAX_POOL_CONNECTIONS = 50
+
+# Global secondary indexes: index name -> (hash key attribute, range key attribute)
+GLOBAL_SECONDARY_INDEXES: Dict[str, Tuple[str, str]] = {
+    "GSI1": ("GSI1PK", "GSI1SK"),
+    # Entity type partitions ordered by GSI2SK (the expense date for expenses)
+    "GSI2": ("EntityType", "GSI2SK"),
+}
+
+# Key schema of the base table, keyed like the GSIs (None = no IndexName)
+_KEY_SCHEMAS: Dict[Optional[str], Tuple[str, str]] = {
+    None: ("PK", "SK"),
+    **GLOBAL_SECONDARY_INDEXES,
+}
+
+_range_value = itemgetter(0)
+
 
 def _raise_client_error(code: str, message: str, operation: str) -> None:
     """Raise a boto-style ClientError for in-memory operations."""
@@ -37,37 +60,185 @@ def _extract_attr_name(candidate: Any) -> str:
     return getattr(candidate, "name", "")
 
 
+def _evaluate_equals(item: Dict[str, Any], values: Tuple[Any, ...]) -> bool:
+    return item.get(_extract_attr_name(values[0])) == values[1]
+
+
+def _evaluate_begins_with(item: Dict[str, Any], values: Tuple[Any, ...]) -> bool:
+    attr_value = item.get(_extract_attr_name(values[0]))
+    return isinstance(attr_value, str) and attr_value.startswith(values[1])
+
+
+def _evaluate_gte(item: Dict[str, Any], values: Tuple[Any, ...]) -> bool:
+    attr_value = item.get(_extract_attr_name(values[0]))
+    return attr_value is not None and attr_value >= values[1]
+
+
+def _evaluate_lte(item: Dict[str, Any], values: Tuple[Any, ...]) -> bool:
+    attr_value = item.get(_extract_attr_name(values[0]))
+    return attr_value is not None and attr_value <= values[1]
+
+
+def _evaluate_exists(item: Dict[str, Any], values: Tuple[Any, ...]) -> bool:
+    return _extract_attr_name(values[0]) in item
+
+
+def _evaluate_and(item: Dict[str, Any], values: Tuple[Any, ...]) -> bool:
+    return all(_evaluate_condition(item, sub_condition) for sub_condition in values)
+
+
+# Condition class name -> evaluator taking (item, condition._values); keyed by
+# name so conditions from any ConditionBase implementation are dispatched
+_CONDITION_EVALUATORS = {
+    "Equals": _evaluate_equals,
+    "BeginsWith": _evaluate_begins_with,
+    "GreaterThanEquals": _evaluate_gte,
+    "LessThanEquals": _evaluate_lte,
+    "AttributeExists": _evaluate_exists,
+    "And": _evaluate_and,
+}
+
+
 def _evaluate_condition(item: Dict[str, Any], condition: ConditionBase) -> bool:
     """Evaluate DynamoDB conditions against a dict.
 
-    Supports: Equals, BeginsWith, GreaterThanEquals, LessThanEquals, And
+    Supports: Equals, BeginsWith, GreaterThanEquals, LessThanEquals,
+    AttributeExists, And
+    """
+
+    evaluator = _CONDITION_EVALUATORS.get(type(condition).__name__)
+    if evaluator is None:
+        return False
+    return evaluator(item, condition._values)
+
+
+@lru_cache(maxsize=128)
+def _parse_update_expression(expression: str) -> Tuple[Tuple[str, str], ...]:
+    """Parse a ``SET a = :a, b = :b`` expression into (attribute, placeholder) pairs."""
+
+    assignments = []
+    for assignment in expression.replace("SET", "").split(","):
+        attr, value_key = assignment.strip().split("=", 1)
+        assignments.append((attr.strip(), value_key.strip()))
+    return tuple(assignments)
+
+
+def _split_key_condition(
+    condition: ConditionBase, hash_key: str
+) -> Tuple[Any, Optional[ConditionBase]]:
+    """Split a key condition into the hash key value and the range key condition."""
+
+    if condition.__class__.__name__ == "And":
+        parts = getattr(condition, "_values", ())
+    else:
+        parts = (condition,)
+
+    hash_value = None
+    range_condition = None
+    for part in parts:
+        values = getattr(part, "_values", ())
+        if (
+            part.__class__.__name__ == "Equals"
+            and _extract_attr_name(values[0]) == hash_key
+        ):
+            hash_value = values[1]
+        else:
+            range_condition = part
+
+    return hash_value, range_condition
+
+
+def _range_slice(
+    entries: List[Tuple[Any, Tuple[str, str]]], condition: Optional[ConditionBase]
+) -> Optional[slice]:
+    """Resolve a range key condition to a slice of the sorted index entries.
+
+    Returns None when the condition cannot be answered from the sort order.
     """
 
+    if condition is None:
+        return slice(0, len(entries))
+
     condition_type = condition.__class__.__name__
     values = getattr(condition, "_values", ())
 
-    # Handle compound condition
-    if condition_type == "And":
-        return all(_evaluate_condition(item, sub_condition) for sub_condition in values)
-
-    if not values:
-        return False
+    def lower(value: Any) -> int:
+        return bisect_left(entries, value, key=_range_value)
 
-    attr_name = _extract_attr_name(values[0])
-    attr_value = item.get(attr_name)
+    def upper(value: Any) -> int:
+        return bisect_right(entries, value, key=_range_value)
 
-    # Handle comparison conditions
     if condition_type == "Equals":
-        return attr_value == values[1]
+        return slice(lower(values[1]), upper(values[1]))
     if condition_type == "BeginsWith":
         prefix = values[1]
-        return isinstance(attr_value, str) and attr_value.startswith(prefix)
+        if not prefix:
+            return slice(0, len(entries))
+        successor = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        return slice(lower(prefix), lower(successor))
+    if condition_type == "Between":
+        return slice(lower(values[1]), upper(values[2]))
     if condition_type == "GreaterThanEquals":
-        return attr_value is not None and attr_value >= values[1]
+        return slice(lower(values[1]), len(entries))
+    if condition_type == "GreaterThan":
+        return slice(upper(values[1]), len(entries))
     if condition_type == "LessThanEquals":
-        return attr_value is not None and attr_value <= values[1]
+        return slice(0, upper(values[1]))
+    if condition_type == "LessThan":
+        return slice(0, lower(values[1]))
 
-    return False
+    return None
+
+
+def _projected_attributes(
+    projection: str, attribute_names: Optional[Dict[str, str]]
+) -> List[str]:
+    """Resolve a ProjectionExpression like "#a, b" into attribute names."""
+    names = attribute_names or {}
+    return [
+        names.get(token, token)
+        for token in (part.strip() for part in projection.split(","))
+    ]
+
+
+class InMemoryBatchWriter:
+    """Buffer puts/deletes and apply them on exit, mirroring boto3's BatchWriter."""
+
+    def __init__(
+        self, table: "InMemoryDynamoTable", overwrite_by_pkeys: Optional[List[str]]
+    ):
+        self._table = table
+        self._overwrite_by_pkeys = overwrite_by_pkeys
+        self._requests: List[Tuple[str, Dict[str, Any]]] = []
+
+    def _drop_duplicate(self, key: Dict[str, Any]) -> None:
+        if not self._overwrite_by_pkeys:
+            return
+        pkey = tuple(key[name] for name in self._overwrite_by_pkeys)
+        self._requests = [
+            (action, payload)
+            for action, payload in self._requests
+            if tuple(payload[name] for name in self._overwrite_by_pkeys) != pkey
+        ]
+
+    def put_item(self, Item: Dict[str, Any]) -> None:
+        self._drop_duplicate(Item)
+        self._requests.append(("put", Item))
+
+    def delete_item(self, Key: Dict[str, Any]) -> None:
+        self._drop_duplicate(Key)
+        self._requests.append(("delete", Key))
+
+    def __enter__(self) -> "InMemoryBatchWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        for action, payload in self._requests:
+            if action == "put":
+                self._table.put_item(Item=payload)
+            else:
+                self._table.delete_item(Key=payload)
+        self._requests = []
 
 
 class InMemoryDynamoTable:
@@ -77,6 +248,28 @@ class InMemoryDynamoTable:
         self.table_name = table_name
         self._items: Dict[Tuple[str, str], Dict[str, Any]] = {}
         self._current_scope: Optional[str] = None
+        # index name -> hash key value -> entries sorted by range key value
+        self._indexes: Dict[
+            Optional[str], Dict[Any, List[Tuple[Any, Tuple[str, str]]]]
+        ] = {index_name: {} for index_name in _KEY_SCHEMAS}
+
+    def _index_item(self, key: Tuple[str, str], item: Dict[str, Any]) -> None:
+        for index_name, (hash_key, range_key) in _KEY_SCHEMAS.items():
+            if hash_key in item and range_key in item:
+                partition = self._indexes[index_name].setdefault(item[hash_key], [])
+                insort(partition, (item[range_key], key), key=_range_value)
+
+    def _unindex_item(self, key: Tuple[str, str], item: Dict[str, Any]) -> None:
+        for index_name, (hash_key, range_key) in _KEY_SCHEMAS.items():
+            if hash_key not in item or range_key not in item:
+                continue
+            partition = self._indexes[index_name].get(item[hash_key], [])
+            position = bisect_left(partition, item[range_key], key=_range_value)
+            while position < len(partition):
+                if partition[position][1] == key:
+                    del partition[position]
+                    break
+                position += 1
 
     def _maybe_reset_for_test(self) -> None:
         """No-op: test data cleanup is handled by test fixtures."""
@@ -88,6 +281,8 @@ class InMemoryDynamoTable:
 
     def delete(self) -> None:
         self._items.clear()
+        for partitions in self._indexes.values():
+            partitions.clear()
 
     # CRUD operations ------------------------------------------------------------------
     def put_item(
@@ -105,7 +300,12 @@ class InMemoryDynamoTable:
                     "PutItem",
                 )
 
+        previous = self._items.get(key)
+        if previous is not None:
+            self._unindex_item(key, previous)
+
         self._items[key] = Item.copy()
+        self._index_item(key, self._items[key])
         return {"ResponseMetadata": {}}
 
     def get_item(self, Key: Dict[str, str]) -> Dict[str, Any]:
@@ -113,14 +313,23 @@ class InMemoryDynamoTable:
         item = self._items.get(key)
         return {"Item": item.copy()} if item else {}
 
+    def batch_writer(
+        self, overwrite_by_pkeys: Optional[List[str]] = None
+    ) -> InMemoryBatchWriter:
+        return InMemoryBatchWriter(self, overwrite_by_pkeys)
+
     def _filter_items(
         self, filter_expression: Optional[ConditionBase]
     ) -> List[Dict[str, Any]]:
-        items = [item.copy() for item in self._items.values()]
         if not filter_expression:
-            return items
+            return [item.copy() for item in self._items.values()]
 
-        return [item for item in items if _evaluate_condition(item, filter_expression)]
+        # Copy only the items that pass the filter
+        return [
+            item.copy()
+            for item in self._items.values()
+            if _evaluate_condition(item, filter_expression)
+        ]
 
     def scan(self, FilterExpression: Optional[ConditionBase] = None) -> Dict[str, Any]:
         items = self._filter_items(FilterExpression)
@@ -130,13 +339,50 @@ class InMemoryDynamoTable:
         self,
         KeyConditionExpression: ConditionBase,
         IndexName: Optional[str] = None,
+        ScanIndexForward: bool = True,
+        Limit: Optional[int] = None,
+        FilterExpression: Optional[ConditionBase] = None,
+        ProjectionExpression: Optional[str] = None,
+        ExpressionAttributeNames: Optional[Dict[str, str]] = None,
     ) -> Dict[str, Any]:
-        # IndexName is ignored because items already carry their index attributes.
-        items = [item.copy() for item in self._items.values()]
-        filtered = [
-            item for item in items if _evaluate_condition(item, KeyConditionExpression)
-        ]
-        return {"Items": filtered, "Count": len(filtered)}
+        hash_key, _ = _KEY_SCHEMAS[IndexName]
+        hash_value, range_condition = _split_key_condition(
+            KeyConditionExpression, hash_key
+        )
+        entries = self._indexes[IndexName].get(hash_value, [])
+        bounds = _range_slice(entries, range_condition)
+
+        if bounds is None:
+            # Unsupported range operator: evaluate the partition entry by entry
+            matched = [
+                self._items[key]
+                for _, key in entries
+                if _evaluate_condition(self._items[key], range_condition)
+            ]
+        else:
+            matched = [self._items[key] for _, key in entries[bounds]]
+
+        if not ScanIndexForward:
+            matched.reverse()
+        if Limit is not None:
+            matched = matched[:Limit]
+        if FilterExpression is not None:
+            # DynamoDB applies filters after Limit
+            matched = [
+                item for item in matched if _evaluate_condition(item, FilterExpression)
+            ]
+
+        if ProjectionExpression is not None:
+            attributes = _projected_attributes(
+                ProjectionExpression, ExpressionAttributeNames
+            )
+            items = [
+                {name: item[name] for name in attributes if name in item}
+                for item in matched
+            ]
+        else:
+            items = [item.copy() for item in matched]
+        return {"Items": items, "Count": len(items)}
 
     def update_item(
         self,
@@ -158,15 +404,14 @@ class InMemoryDynamoTable:
 
         if item is None:
             item = {}
+        else:
+            self._unindex_item(key, item)
 
-        assignments = UpdateExpression.replace("SET", "").split(",")
-        for assignment in assignments:
-            attr, value_key = assignment.strip().split("=", 1)
-            attr = attr.strip()
-            value = ExpressionAttributeValues[value_key.strip()]
-            item[attr] = value
+        for attr, value_key in _parse_update_expression(UpdateExpression):
+            item[attr] = ExpressionAttributeValues[value_key]
 
         self._items[key] = item
+        self._index_item(key, item)
 
         if ReturnValues == "ALL_NEW":
             return {"Attributes": item.copy()}
@@ -187,7 +432,7 @@ class InMemoryDynamoTable:
                 )
             return {"ResponseMetadata": {}}
 
-        del self._items[key]
+        self._unindex_item(key, self._items.pop(key))
         return {"ResponseMetadata": {}}
 
 
@@ -223,8 +468,19 @@ class DynamoDBSetup:
                 or os.getenv("AWS_REGION")
                 or "ap-southeast-2"
             )
-            self.dynamodb = boto3.resource("dynamodb", region_name=region)
+            client_config = Config(
+                max_pool_connections=MAX_POOL_CONNECTIONS,
+                retries={"max_attempts": 3, "mode": "adaptive"},
+                # Keep pooled connections alive between requests on a warm
+                # instance so calls skip a new TCP/TLS handshake
+                tcp_keepalive=True,
+            )
+            self.dynamodb = boto3.resource(
+                "dynamodb", region_name=region, config=client_config
+            )
             self.table_name = os.getenv("DYNAMODB_TABLE_NAME", "expense-tracker")
+            # Reuse one Table resource instead of rebuilding it per call
+            self.table = self.dynamodb.Table(self.table_name)
 
         self._initialized = True
 
@@ -235,8 +491,7 @@ class DynamoDBSetup:
             return True
 
         try:
-            table = self.dynamodb.Table(self.table_name)
-            table.load()
+            self.table.load()
             logger.info(f"Table {self.table_name} already exists")
             return True
         except ClientError as e:
@@ -250,6 +505,12 @@ class DynamoDBSetup:
 
         try:
             # Build table configuration based on environment
+            key_attributes = ["PK", "SK"]
+            for hash_key, range_key in GLOBAL_SECONDARY_INDEXES.values():
+                for attribute in (hash_key, range_key):
+                    if attribute not in key_attributes:
+                        key_attributes.append(attribute)
+
             table_config = {
                 "TableName": self.table_name,
                 "KeySchema": [
@@ -257,23 +518,25 @@ class DynamoDBSetup:
                     {"AttributeName": "SK", "KeyType": "RANGE"},
                 ],
                 "AttributeDefinitions": [
-                    {"AttributeName": "PK", "AttributeType": "S"},
-                    {"AttributeName": "SK", "AttributeType": "S"},
-                    {"AttributeName": "GSI1PK", "AttributeType": "S"},
-                    {"AttributeName": "GSI1SK", "AttributeType": "S"},
+                    {"AttributeName": attribute, "AttributeType": "S"}
+                    for attribute in key_attributes
                 ],
             }
 
             # Use PAY_PER_REQUEST for both local and production
             table_config["GlobalSecondaryIndexes"] = [
                 {
-                    "IndexName": "GSI1",
+                    "IndexName": index_name,
                     "KeySchema": [
-                        {"AttributeName": "GSI1PK", "KeyType": "HASH"},
-                        {"AttributeName": "GSI1SK", "KeyType": "RANGE"},
+                        {"AttributeName": hash_key, "KeyType": "HASH"},
+                        {"AttributeName": range_key, "KeyType": "RANGE"},
                     ],
                     "Projection": {"ProjectionType": "ALL"},
-                },
+                }
+                for index_name, (
+                    hash_key,
+                    range_key,
+                ) in GLOBAL_SECONDARY_INDEXES.items()
             ]
             table_config["BillingMode"] = "PAY_PER_REQUEST"
 
@@ -291,9 +554,7 @@ class DynamoDBSetup:
     def get_table(self):
         """Get reference to the DynamoDB table."""
 
-        if self.is_local:
-            return self.table
-        return self.dynamodb.Table(self.table_name)
+        return self.table
 
 
 def initialize_database() -> bool:
@@ -1,30 +1,30 @@
 from datetime import datetime, UTC
 from decimal import Decimal
-from typing import List, Optional
+from typing import Annotated, List, Optional, Tuple
 from uuid import uuid4
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    Field,
+    StringConstraints,
+    field_validator,
+    model_validator,
+)
+
+from core.text_utils import normalize_text
+
+# Required text field: surrounding whitespace is stripped and the result must not
+# be empty; enforced by pydantic-core rather than a Python validator
+NonEmptyStr = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
 
 
 class Owner(BaseModel):
     """Owner entity - immutable after creation."""
 
-    name: str = Field(..., description="Unique owner name")
-    card_name: str = Field(..., description="Name as appears on card")
+    name: NonEmptyStr = Field(..., description="Unique owner name")
+    card_name: NonEmptyStr = Field(..., description="Name as appears on card")
     created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
 
-    @field_validator("name")
-    def name_must_not_be_empty(cls, value: str) -> str:
-        if not value or not value.strip():
-            raise ValueError("Owner name cannot be empty")
-        return value.strip()
-
-    @field_validator("card_name")
-    def card_name_must_not_be_empty(cls, value: str) -> str:
-        if not value or not value.strip():
-            raise ValueError("Card name cannot be empty")
-        return value.strip()
-
     def get_pk(self) -> str:
         return f"OWNER#{self.name}"
 
@@ -42,39 +42,15 @@ class OwnerCreate(BaseModel):
 class Account(BaseModel):
     """Account entity."""
 
-    account_name: str = Field(..., description="Account name")
-    bank_name: str = Field(..., description="Bank name")
-    owner_name: str = Field(..., description="Owner name (foreign key)")
-    card_member: str = Field(
+    account_name: NonEmptyStr = Field(..., description="Account name")
+    bank_name: NonEmptyStr = Field(..., description="Bank name")
+    owner_name: NonEmptyStr = Field(..., description="Owner name (foreign key)")
+    card_member: NonEmptyStr = Field(
         ..., description="Card member name (must match Owner.card_name)"
     )
     active: bool = Field(default=True, description="Account active status")
     created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
 
-    @field_validator("account_name")
-    def account_name_must_not_be_empty(cls, value: str) -> str:
-        if not value or not value.strip():
-            raise ValueError("Account name cannot be empty")
-        return value.strip()
-
-    @field_validator("bank_name")
-    def bank_name_must_not_be_empty(cls, value: str) -> str:
-        if not value or not value.strip():
-            raise ValueError("Bank name cannot be empty")
-        return value.strip()
-
-    @field_validator("owner_name")
-    def owner_name_must_not_be_empty(cls, value: str) -> str:
-        if not value or not value.strip():
-            raise ValueError("Owner name cannot be empty")
-        return value.strip()
-
-    @field_validator("card_member")
-    def card_member_must_not_be_empty(cls, value: str) -> str:
-        if not value or not value.strip():
-            raise ValueError("Card member cannot be empty")
-        return value.strip()
-
     def get_pk(self) -> str:
         return f"ACCOUNT#{self.account_name}#{self.owner_name}"
 
@@ -105,37 +81,19 @@ class AccountUpdate(BaseModel):
 class Category(BaseModel):
     """Category entity."""
 
-    name: str = Field(..., description="Unique category name")
+    name: NonEmptyStr = Field(..., description="Unique category name")
     labels: List[str] = Field(
         default_factory=list, description="List of labels for auto-categorization"
     )
-    account_id: str = Field(
+    account_id: NonEmptyStr = Field(
         ..., description="Associated account ID (account_name + space + owner_name)"
     )
-    card_name: str = Field(
+    card_name: NonEmptyStr = Field(
         ..., description="Card name (foreign key to Owner.card_name)"
     )
     active: bool = Field(default=True, description="Category active status")
     created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
 
-    @field_validator("name")
-    def name_must_not_be_empty(cls, value: str) -> str:
-        if not value or not value.strip():
-            raise ValueError("Category name cannot be empty")
-        return value.strip()
-
-    @field_validator("account_id")
-    def account_id_must_not_be_empty(cls, value: str) -> str:
-        if not value or not value.strip():
-            raise ValueError("Account ID cannot be empty")
-        return value.strip()
-
-    @field_validator("card_name")
-    def card_name_must_not_be_empty(cls, value: str) -> str:
-        if not value or not value.strip():
-            raise ValueError("Card name cannot be empty")
-        return value.strip()
-
     @field_validator("labels")
     def labels_must_be_clean(cls, value: Optional[List[str]]) -> List[str]:
         if value is None:
@@ -143,6 +101,16 @@ class Category(BaseModel):
         # Remove empty strings and strip whitespace
         return [label.strip() for label in value if label and label.strip()]
 
+    @property
+    def normalized_labels(self) -> Tuple[str, ...]:
+        """Non-empty normalized labels for matching (normalize_text is cached)."""
+        return tuple(label for label in map(normalize_text, self.labels) if label)
+
+    @property
+    def normalized_card_name(self) -> str:
+        """Normalized card_name for matching (normalize_text is cached)."""
+        return normalize_text(self.card_name)
+
     def get_pk(self) -> str:
         return f"CATEGORY#{self.name}"
 
@@ -166,6 +134,13 @@ class CategoryUpdate(BaseModel):
     labels: Optional[List[str]] = None
     active: Optional[bool] = None
 
+    @field_validator("labels")
+    def labels_must_be_clean(cls, value: Optional[List[str]]) -> Optional[List[str]]:
+        if value is None:
+            return None
+        # Same cleaning as Category, which is built without validation on read
+        return [label.strip() for label in value if label and label.strip()]
+
 
 class Expense(BaseModel):
     """Expense entity with time-based partitioning."""
@@ -174,8 +149,8 @@ class Expense(BaseModel):
         default_factory=lambda: str(uuid4()), description="Unique expense ID"
     )
     date: datetime = Field(..., description="Expense date")
-    description: str = Field(..., description="Expense description")
-    card_member: str = Field(..., description="Card member name")
+    description: NonEmptyStr = Field(..., description="Expense description")
+    card_member: NonEmptyStr = Field(..., description="Card member name")
     assigned_card_member: Optional[str] = Field(
         None, description="Assigned card member (defaults to card_member)"
     )
@@ -207,30 +182,15 @@ class Expense(BaseModel):
     created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
 
     @model_validator(mode="after")
-    def set_assigned_card_member_default(self):
+    def apply_defaults(self):
+        """Default assigned_card_member to card_member, and enforce rule: category_hint
+        becomes required (non-null list) after auto-categorization."""
         if self.assigned_card_member is None:
             self.assigned_card_member = self.card_member
-        return self
-
-    @model_validator(mode="after")
-    def enforce_category_hint_requirement(self):
-        """Enforce rule: category_hint becomes required (non-null list) after auto-categorization."""
         if self.is_auto_categorized and self.category_hint is None:
             self.category_hint = []
         return self
 
-    @field_validator("description")
-    def description_must_not_be_empty(cls, value: str) -> str:
-        if not value or not value.strip():
-            raise ValueError("Description cannot be empty")
-        return value.strip()
-
-    @field_validator("card_member")
-    def card_member_must_not_be_empty(cls, value: str) -> str:
-        if not value or not value.strip():
-            raise ValueError("Card member cannot be empty")
-        return value.strip()
-
     def get_pk(self) -> str:
         """Primary key: EXPENSE#{expense_id}."""
         return f"EXPENSE#{self.expense_id}"
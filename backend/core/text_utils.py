@@ -1,7 +1,33 @@
 import re
+import string
+from functools import lru_cache
 from typing import Optional
 
+# ASCII characters outside [A-Za-z0-9_] and whitespace map to a space
+_ASCII_NON_WORD_TO_SPACE = str.maketrans(
+    {
+        chr(code): " "
+        for code in range(128)
+        if not (chr(code).isalnum() or chr(code) == "_" or chr(code).isspace())
+    }
+)
 
+# Same mapping, also lowercasing A-Z, so ASCII input needs a single pass
+_ASCII_LOWER_NON_WORD_TO_SPACE = {
+    **_ASCII_NON_WORD_TO_SPACE,
+    **str.maketrans(string.ascii_uppercase, string.ascii_lowercase),
+}
+
+# Fallback for punctuation outside ASCII
+_NON_WORD_PATTERN = re.compile(r"[^\w\s]")
+
+
+# Category labels and card names come from a small set of strings that are
+# normalized again for every expense, so cache results
+NORMALIZE_CACHE_SIZE = 8192
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
 def normalize_text(text: Optional[str]) -> str:
     """
     Normalize text for matching across the application (services, repositories, etc.).
@@ -19,13 +45,14 @@ def normalize_text(text: Optional[str]) -> str:
     if not text:
         return ""
 
-    # Convert to lowercase and trim
-    normalized = text.lower().strip()
-
-    # Remove punctuation and special characters, keep alphanumeric and spaces
-    normalized = re.sub(r"[^\w\s]", " ", normalized)
-
-    # Collapse multiple spaces into a single space
-    normalized = re.sub(r"\s+", " ", normalized).strip()
-
-    return normalized
+    if text.isascii():
+        # Lowercase and remove punctuation in a single translate pass
+        normalized = text.translate(_ASCII_LOWER_NON_WORD_TO_SPACE)
+    else:
+        # Remove any remaining (non-ASCII) punctuation and special characters
+        normalized = _NON_WORD_PATTERN.sub(
+            " ", text.lower().translate(_ASCII_NON_WORD_TO_SPACE)
+        )
+
+    # Trim and collapse whitespace runs into a single space
+    return " ".join(normalized.split())
@@ -1,22 +1,85 @@
 import logging
 from datetime import datetime, timedelta
-from decimal import Decimal
-from typing import List, Optional
+from decimal import ROUND_FLOOR, Decimal
+from typing import Dict, List, Optional, Tuple
 
-from core.models import Expense
+from core.models import Category, Expense
 from core.text_utils import normalize_text
 from services import dynamo_expenses as db
 
 logger = logging.getLogger(__name__)
 
+# Expense attributes read for historical matching (plus those Expense requires)
+HISTORY_EXPENSE_ATTRIBUTES = (
+    "expense_id",
+    "date",
+    "description",
+    "card_member",
+    "amount",
+    "category",
+    "created_at",
+)
+
+# (normalized card_name, category name, normalized non-empty labels)
+LabelIndexEntry = Tuple[str, str, Tuple[str, ...]]
+
+
+def _build_label_index(categories: List[Category]) -> List[LabelIndexEntry]:
+    """Collect active categories' normalized card names and labels in list order."""
+    return [
+        (category.normalized_card_name, category.name, category.normalized_labels)
+        for category in categories
+        if category.active and category.normalized_labels
+    ]
+
+
+def _build_unknown_index(categories: List[Category]) -> Dict[str, str]:
+    """Map normalized card names to their first "-Unknown" category in list order."""
+    unknown_index: Dict[str, str] = {}
+    for category in categories:
+        if category.name.endswith("-Unknown"):
+            unknown_index.setdefault(category.normalized_card_name, category.name)
+    return unknown_index
+
+
+# (normalized description, amount in whole cents rounded down) ->
+# [(position in recency order, whether the amount is whole cents, amount, category)]
+HistoricalIndex = Dict[Tuple[str, int], List[Tuple[int, bool, Decimal, str]]]
+
+
+def _amount_cents(amount: Decimal) -> Tuple[int, bool]:
+    """
+    Bucket an amount by whole cents; amounts within 0.01 share or neighbor a bucket.
+
+    Returns:
+        Tuple of (cents rounded down, whether the amount was already whole cents)
+    """
+    scaled = amount * 100
+    cents = int(scaled.to_integral_value(rounding=ROUND_FLOOR))
+    return cents, scaled == cents
+
 
 class AutoCategorizationService:
-    """Service for automatically categorizing expenses based on historical data and label matching."""
+    """Service for automatically categorizing expenses based on historical data and label matching.
+
+    Category labels and Unknown categories are loaded once per service
+    instance, so create a new instance per request or upload to pick up
+    category changes.
+    """
 
     def __init__(self):
-        pass
+        self._label_index: Optional[List[LabelIndexEntry]] = None
+        self._unknown_index: Optional[Dict[str, str]] = None
+
+    def _get_label_index(self) -> List[LabelIndexEntry]:
+        """Return the label index, building it on first use."""
+        if self._label_index is None:
+            self._label_index = _build_label_index(db.list_categories())
+        return self._label_index
 
-    def categorize_expense(self, expense: Expense) -> Expense:
+    def categorize_expense(
+        self, expense: Expense, history: Optional[HistoricalIndex] = None
+    ) -> Expense:
         """
         Auto-categorize a single expense using the 3-step logic:
         1. Historical exact match (last 3 months)
@@ -27,6 +90,7 @@ class AutoCategorizationService:
 
         Args:
             expense: Expense to categorize
+            history: Index from load_history(), shared when categorizing a batch
 
         Returns:
             Updated expense with category, category_hint, and assigned_card_member populated
@@ -34,7 +98,7 @@ class AutoCategorizationService:
         logger.info(f"Auto-categorizing expense: {expense.expense_id}")
 
         # Step 1: Check for historical exact match
-        historical_category = self._find_historical_match(expense)
+        historical_category = self._find_historical_match(expense, history)
         if historical_category:
             expense.category = historical_category
             expense.is_auto_categorized = True
@@ -74,33 +138,74 @@ class AutoCategorizationService:
 
         return expense
 
-    def _find_historical_match(self, expense: Expense) -> Optional[str]:
+    def categorize_expenses(self, expenses: List[Expense]) -> List[Expense]:
+        """Auto-categorize a batch of expenses against a single history load."""
+        history = self.load_history()
+        return [self.categorize_expense(expense, history) for expense in expenses]
+
+    def load_history(self) -> HistoricalIndex:
+        """
+        Index categorized expenses from the last 3 months for historical matching.
+
+        Returns:
+            Index keyed by normalized description and amount in cents
+        """
+        three_months_ago = datetime.now() - timedelta(days=90)
+        recent_expenses = self._get_recent_categorized_expenses(three_months_ago)
+
+        history: HistoricalIndex = {}
+        for position, historical_expense in enumerate(recent_expenses):
+            cents, whole_cents = _amount_cents(historical_expense.amount)
+            key = (normalize_text(historical_expense.description), cents)
+            history.setdefault(key, []).append(
+                (
+                    position,
+                    whole_cents,
+                    historical_expense.amount,
+                    historical_expense.category,
+                )
+            )
+        return history
+
+    def _find_historical_match(
+        self, expense: Expense, history: Optional[HistoricalIndex] = None
+    ) -> Optional[str]:
         """
         Find exact historical match from last 3 months.
 
         Args:
             expense: Expense to match against
+            history: Index from load_history(); loaded on demand when omitted
 
         Returns:
             Category name if exact match found, None otherwise
         """
-        # Get expenses from last 3 months
-        three_months_ago = datetime.now() - timedelta(days=90)
-
         try:
-            # Query recent categorized expenses
-            recent_expenses = self._get_recent_categorized_expenses(three_months_ago)
+            if history is None:
+                history = self.load_history()
 
             normalized_desc = normalize_text(expense.description)
-
-            for historical_expense in recent_expenses:
-                historical_desc = normalize_text(historical_expense.description)
-
-                # Check exact match on normalized description and amount
-                if normalized_desc == historical_desc and self._amounts_equal(
-                    expense.amount, historical_expense.amount
+            cents, whole_cents = _amount_cents(expense.amount)
+
+            # Amounts within tolerance fall in the same or an adjacent cent bucket;
+            # the most recent match wins, as in a newest-first linear scan.
+            # Whole-cent amounts in those buckets are at most 1 cent apart, so
+            # only sub-cent amounts need the Decimal comparison
+            best: Optional[Tuple[int, str]] = None
+            for bucket in (cents - 1, cents, cents + 1):
+                for position, entry_whole_cents, amount, category in history.get(
+                    (normalized_desc, bucket), ()
                 ):
-                    return historical_expense.category
+                    if best is not None and position >= best[0]:
+                        break
+                    if (whole_cents and entry_whole_cents) or self._amounts_equal(
+                        expense.amount, amount
+                    ):
+                        best = (position, category)
+                        break
+
+            if best is not None:
+                return best[1]
 
         except Exception as e:
             logger.error(f"Error in historical match: {e}")
@@ -111,9 +216,9 @@ class AutoCategorizationService:
         """
         Find label match using simple substring matching with card-member priority.
 
-        Iterates through categories (prioritized by matching card_name),
-        normalizes each label, and returns the first category where a label
-        appears as a substring in the normalized description.
+        Iterates through categories (prioritized by matching card_name) using
+        the pre-normalized label index, and returns the first category where a
+        label appears as a substring in the normalized description.
 
         Args:
             expense: Expense to match against
@@ -122,39 +227,26 @@ class AutoCategorizationService:
             Category name if match found, None otherwise
         """
         try:
-            # Get all active categories
-            categories = db.list_categories()
-            active_categories = [cat for cat in categories if cat.active]
+            label_index = self._get_label_index()
 
-            # Prioritize categories matching the expense's card_member
             normalized_card_member = normalize_text(expense.card_member)
-            matching_card_categories = [
-                cat
-                for cat in active_categories
-                if normalize_text(cat.card_name) == normalized_card_member
-            ]
-            other_categories = [
-                cat
-                for cat in active_categories
-                if normalize_text(cat.card_name) != normalized_card_member
-            ]
-            prioritized_categories = matching_card_categories + other_categories
-
             normalized_desc = normalize_text(expense.description)
             logger.debug(f"Normalized description: '{normalized_desc}'")
             logger.debug(
-                f"Checking {len(prioritized_categories)} categories (card-member prioritized)"
+                f"Checking {len(label_index)} categories (card-member prioritized)"
             )
 
-            # Check each category's labels for substring match
-            for category in prioritized_categories:
-                for label in category.labels:
-                    normalized_label = normalize_text(label)
-                    if normalized_label and normalized_label in normalized_desc:
-                        logger.info(
-                            f"Label match: '{label}' found in description for category '{category.name}'"
-                        )
-                        return category.name
+            # Categories matching the expense's card_member first, then the rest
+            for prefer_card_member in (True, False):
+                for card_name, category_name, labels in label_index:
+                    if (card_name == normalized_card_member) != prefer_card_member:
+                        continue
+                    for label in labels:
+                        if label in normalized_desc:
+                            logger.info(
+                                f"Label match: '{label}' found in description for category '{category_name}'"
+                            )
+                            return category_name
 
             logger.debug("No label matches found")
             return None
@@ -165,22 +257,18 @@ class AutoCategorizationService:
 
     def _get_recent_categorized_expenses(self, since_date: datetime) -> List[Expense]:
         """Get categorized expenses since the given date."""
-        # This is a simplified approach - in production you'd want more efficient querying
         from core.models import ExpenseFilter
 
+        # Date-range query on the GSI2 date index, reading only matching fields
         expense_filter = ExpenseFilter(start_date=since_date)
-        all_recent = db.list_expenses(expense_filter)
+        all_recent = db.list_expenses(expense_filter, HISTORY_EXPENSE_ATTRIBUTES)
 
         # Filter to only categorized expenses (not "Unknown")
         return [exp for exp in all_recent if exp.category and exp.category != "Unknown"]
 
-    @staticmethod
-    def _normalize_text(text: Optional[str]) -> str:
-        """
-        DEPRECATED: Use core.text_utils.normalize_text instead.
-        This wrapper remains for backward compatibility in tests/usages.
-        """
-        return normalize_text(text)
+    # DEPRECATED: Use core.text_utils.normalize_text instead.
+    # Kept as a direct alias for backward compatibility in tests/usages.
+    _normalize_text = staticmethod(normalize_text)
 
     def _amounts_equal(
         self, amount1: Decimal, amount2: Decimal, tolerance: Decimal = Decimal("0.01")
@@ -209,7 +297,7 @@ class AutoCategorizationService:
             category_name: Name of the assigned category
         """
         try:
-            category = db.get_category(category_name)
+            category = db.get_category_cached(category_name)
             if category:
                 if not category.card_name:
                     raise ValueError(f"Category '{category_name}' has no card_name")
@@ -241,21 +329,18 @@ class AutoCategorizationService:
             Category name of matching Unknown category, or None if not found
         """
         try:
-            # Get all categories
-            categories = db.list_categories()
-
-            # Filter for Unknown categories (names ending with "-Unknown")
-            unknown_categories = [
-                cat for cat in categories if cat.name.endswith("-Unknown")
-            ]
+            # Unknown categories (names ending with "-Unknown") by card_name,
+            # indexed once per service instance
+            if self._unknown_index is None:
+                self._unknown_index = _build_unknown_index(db.list_categories())
 
             # Find the one matching this card_member
-            for category in unknown_categories:
-                if normalize_text(category.card_name) == normalize_text(card_member):
-                    logger.debug(
-                        f"Found Unknown category '{category.name}' for card_member '{card_member}'"
-                    )
-                    return category.name
+            category_name = self._unknown_index.get(normalize_text(card_member))
+            if category_name:
+                logger.debug(
+                    f"Found Unknown category '{category_name}' for card_member '{card_member}'"
+                )
+                return category_name
 
             logger.warning(f"No Unknown category found for card_member: {card_member}")
             return None
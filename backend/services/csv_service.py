@@ -1,14 +1,42 @@
+import codecs
 import csv
 import logging
+import os
 from datetime import datetime
-from decimal import Decimal
-from io import StringIO
-from typing import List, Dict, Tuple
+from decimal import Decimal, InvalidOperation
+from io import BytesIO, StringIO
+from typing import BinaryIO, Iterable, List, Sequence, Tuple
 
 from core.models import ExpenseCreate
 
 logger = logging.getLogger(__name__)
 
+# Chunk size used when validating uploads without loading them into memory
+VALIDATION_CHUNK_SIZE = 64 * 1024
+
+# Largest CSV file accepted for upload
+MAX_CSV_SIZE_KB = 500
+
+# Characters dropped from amounts before parsing
+_AMOUNT_STRIP_TABLE = str.maketrans("", "", "$,")
+
+# Columns read from each row, in the order _parse_expense_row unpacks them
+CSV_COLUMNS = (
+    "Date",
+    "Description",
+    "Card Member",
+    "Account #",
+    "Amount",
+    "Extended Details",
+    "Appears On Your Statement As",
+    "Address",
+    "City/State",
+    "Zip Code",
+    "Country",
+    "Reference",
+    "Category",
+)
+
 
 def parse_csv_expenses(csv_content: str) -> Tuple[List[ExpenseCreate], List[str]]:
     """
@@ -17,6 +45,21 @@ def parse_csv_expenses(csv_content: str) -> Tuple[List[ExpenseCreate], List[str]
     Args:
         csv_content: Raw CSV file content as string
 
+    Returns:
+        Tuple of (list of ExpenseCreate objects, list of error messages)
+    """
+    return parse_csv_stream(StringIO(csv_content))
+
+
+def parse_csv_stream(
+    csv_stream: Iterable[str],
+) -> Tuple[List[ExpenseCreate], List[str]]:
+    """
+    Parse CSV rows from a text stream (e.g. an uploaded file) row by row.
+
+    Args:
+        csv_stream: Text stream or iterable of CSV lines
+
     Returns:
         Tuple of (list of ExpenseCreate objects, list of error messages)
     """
@@ -24,20 +67,32 @@ def parse_csv_expenses(csv_content: str) -> Tuple[List[ExpenseCreate], List[str]
     errors = []
 
     try:
-        csv_reader = csv.DictReader(StringIO(csv_content))
+        csv_reader = csv.reader(csv_stream)
+        headers = next(csv_reader, None) or []
 
         # Check if required headers exist
         required_headers = {"Date", "Description", "Card Member", "Amount"}
-        if not required_headers.issubset(set(csv_reader.fieldnames or [])):
-            missing = required_headers - set(csv_reader.fieldnames or [])
+        if not required_headers.issubset(headers):
+            missing = required_headers - set(headers)
             errors.append(f"Missing required CSV headers: {', '.join(missing)}")
             return expenses, errors
 
-        for row_num, row in enumerate(
-            csv_reader, start=2
-        ):  # Start at 2 for header line
+        # Resolve column positions once; later duplicates win, as with DictReader
+        header_index = {header: index for index, header in enumerate(headers)}
+        column_indices = tuple(header_index.get(column, -1) for column in CSV_COLUMNS)
+
+        row_num = 1  # Header line
+        for row in csv_reader:
+            if not row:
+                continue  # Skip blank lines
+            row_num += 1
             try:
-                expense = _parse_expense_row(row)
+                # Absent columns and cells read as empty strings
+                values = [
+                    row[index].strip() if 0 <= index < len(row) else ""
+                    for index in column_indices
+                ]
+                expense = _parse_expense_row(values)
                 expenses.append(expense)
             except Exception as e:
                 errors.append(f"Row {row_num}: {str(e)}")
@@ -48,72 +103,102 @@ def parse_csv_expenses(csv_content: str) -> Tuple[List[ExpenseCreate], List[str]
     return expenses, errors
 
 
-def _parse_expense_row(row: Dict[str, str]) -> ExpenseCreate:
-    """Parse a single CSV row into an ExpenseCreate object."""
+def _parse_date(date_str: str) -> datetime:
+    """Parse a DD/MM/YYYY date without strptime.
+
+    Accepts the same inputs as strptime's "%d/%m/%Y": one- or two-digit day
+    and month, four-digit year.
+    """
+    parts = date_str.split("/")
+    if len(parts) == 3:
+        day, month, year = parts
+        if (
+            date_str.isascii()
+            and 1 <= len(day) <= 2
+            and 1 <= len(month) <= 2
+            and len(year) == 4
+            and day.isdigit()
+            and month.isdigit()
+            and year.isdigit()
+        ):
+            try:
+                return datetime(int(year), int(month), int(day))
+            except ValueError:
+                pass
+
+    raise ValueError(f"Invalid date format '{date_str}'. Expected DD/MM/YYYY")
+
+
+def _parse_expense_row(values: Sequence[str]) -> ExpenseCreate:
+    """Parse a row's stripped CSV_COLUMNS values into an ExpenseCreate object."""
+    (
+        date_str,
+        description,
+        card_member,
+        account_number,
+        amount_str,
+        extended_details,
+        appears_on_statement_as,
+        address,
+        city_state,
+        zip_code,
+        country,
+        reference,
+        category_hint_str,
+    ) = values
 
     # Parse date - expect DD/MM/YYYY format
-    date_str = row.get("Date", "").strip()
     if not date_str:
         raise ValueError("Date is required")
 
-    try:
-        parsed_date = datetime.strptime(date_str, "%d/%m/%Y")
-    except ValueError:
-        raise ValueError(f"Invalid date format '{date_str}'. Expected DD/MM/YYYY")
+    parsed_date = _parse_date(date_str)
 
     # Parse amount
-    amount_str = row.get("Amount", "").strip()
     if not amount_str:
         raise ValueError("Amount is required")
 
     try:
         # Remove currency symbols and commas
-        amount_clean = amount_str.replace("$", "").replace(",", "").strip()
+        amount_clean = amount_str.translate(_AMOUNT_STRIP_TABLE).strip()
         amount = Decimal(amount_clean)
-    except (ValueError, TypeError):
+    except (ValueError, TypeError, InvalidOperation):
+        raise ValueError(f"Invalid amount format '{amount_str}'")
+
+    # Decimal accepts NaN/Infinity, which the stored amount must never be
+    if not amount.is_finite():
         raise ValueError(f"Invalid amount format '{amount_str}'")
 
     # Required fields
-    description = row.get("Description", "").strip()
     if not description:
         raise ValueError("Description is required")
 
-    card_member = row.get("Card Member", "").strip()
     if not card_member:
         raise ValueError("Card Member is required")
 
     # Optional fields
-    account_number = row.get("Account #", "").strip() or None
-    extended_details = row.get("Extended Details", "").strip() or None
-    appears_on_statement_as = (
-        row.get("Appears On Your Statement As", "").strip() or None
-    )
-    address = row.get("Address", "").strip() or None
-    city_state = row.get("City/State", "").strip() or None
-    zip_code = row.get("Zip Code", "").strip() or None
-    country = row.get("Country", "").strip() or None
-    reference = row.get("Reference", "").strip() or None
-    category_hint_str = row.get("Category", "").strip()
     category_hint = [category_hint_str] if category_hint_str else None
 
-    return ExpenseCreate(
+    # Every field is parsed and checked above; skip re-validating the row
+    return ExpenseCreate.model_construct(
         date=parsed_date,
         description=description,
         card_member=card_member,
-        account_number=account_number,
+        account_number=account_number or None,
         amount=amount,
-        extended_details=extended_details,
-        appears_on_statement_as=appears_on_statement_as,
-        address=address,
-        city_state=city_state,
-        zip_code=zip_code,
-        country=country,
-        reference=reference,
+        extended_details=extended_details or None,
+        appears_on_statement_as=appears_on_statement_as or None,
+        address=address or None,
+        city_state=city_state or None,
+        zip_code=zip_code or None,
+        country=country or None,
+        reference=reference or None,
         category_hint=category_hint,
     )
 
 
-def validate_csv_file(file_content: bytes, max_size_kb: int = 500) -> List[str]:
+def validate_csv_file(
+    file_content: bytes, max_size_kb: int = MAX_CSV_SIZE_KB
+) -> List[str]:
     """
     Validate CSV file before processing.
 
@@ -121,24 +206,57 @@ def validate_csv_file(file_content: bytes, max_size_kb: int = 500) -> List[str]:
         file_content: Raw file content as bytes
         max_size_kb: Maximum file size in KB
 
+    Returns:
+        List of validation errors (empty if valid)
+    """
+    return validate_csv_stream(BytesIO(file_content), max_size_kb)
+
+
+def validate_csv_stream(
+    file_obj: BinaryIO, max_size_kb: int = MAX_CSV_SIZE_KB
+) -> List[str]:
+    """
+    Validate a seekable binary CSV file without reading it into memory.
+
+    The size comes from the file position; UTF-8 validity is checked in chunks
+    with an incremental decoder. The stream is rewound before returning.
+
+    Args:
+        file_obj: Seekable binary file object
+        max_size_kb: Maximum file size in KB
+
     Returns:
         List of validation errors (empty if valid)
     """
     errors = []
 
     # Check file size
-    file_size_kb = len(file_content) / 1024
+    file_obj.seek(0, os.SEEK_END)
+    file_size = file_obj.tell()
+    file_obj.seek(0)
+
+    file_size_kb = file_size / 1024
     if file_size_kb > max_size_kb:
         errors.append(f"File too large: {file_size_kb:.1f}KB (max {max_size_kb}KB)")
+        return errors
 
     # Check if file is empty
-    if len(file_content) == 0:
+    if file_size == 0:
         errors.append("File is empty")
 
+    decoder = codecs.getincrementaldecoder("utf-8")()
     try:
-        # Try to decode as UTF-8
-        file_content.decode("utf-8")
+        # Try to decode as UTF-8, one chunk at a time
+        while chunk := file_obj.read(VALIDATION_CHUNK_SIZE):
+            # ASCII is valid UTF-8; only decode when there is non-ASCII content
+            # or a multi-byte sequence left over from the previous chunk
+            if chunk.isascii() and not decoder.getstate()[0]:
+                continue
+            decoder.decode(chunk)
+        decoder.decode(b"", final=True)
     except UnicodeDecodeError:
         errors.append("File must be UTF-8 encoded")
+    finally:
+        file_obj.seek(0)
 
     return errors
@@ -4,12 +4,14 @@ Direct CRUD operations without repository abstraction.
 """
 
 import logging
+import time
 from datetime import datetime
 from decimal import Decimal
-from functools import reduce
-from typing import Dict, List, Optional
+from functools import lru_cache
+from operator import attrgetter
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
-from boto3.dynamodb.conditions import Attr, Key
+from boto3.dynamodb.conditions import Attr, ConditionBase, Key
 from botocore.exceptions import ClientError
 
 from core.database import DynamoDBSetup
@@ -27,16 +29,48 @@ from core.models import (
     Owner,
     OwnerCreate,
 )
-from services.categorization_service import normalize_text
+from core.text_utils import normalize_text
 
 logger = logging.getLogger(__name__)
 
-# Initialize database singleton
-_db_setup = DynamoDBSetup()
-_table = _db_setup.get_table()
 
-# Cache for owner card names
-_card_names_cache: Optional[List[str]] = None
+@lru_cache(maxsize=1)
+def _get_table():
+    """Return the DynamoDB table, connecting on first use rather than at import."""
+    return DynamoDBSetup().get_table()
+
+
+# Expense dates and per-upload created_at stamps repeat across items, so
+# parsed timestamps are cached (datetimes are immutable and safe to share)
+ISO_PARSE_CACHE_SIZE = 65536
+
+
+@lru_cache(maxsize=ISO_PARSE_CACHE_SIZE)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp stored on an item."""
+    return datetime.fromisoformat(value)
+
+
+# GSI1 partition holding every expense, sorted by expense_id
+EXPENSE_GSI1PK = "EXPENSE"
+
+# Maximum number of results returned by expense_id prefix search
+SEARCH_RESULT_LIMIT = 1000
+
+# Expenses written per DynamoDB BatchWriteItem call (the service maximum)
+BATCH_WRITE_MAX_ITEMS = 25
+
+# Seconds cached card names are trusted; owners change rarely
+CARD_NAMES_CACHE_TTL_SECONDS = 300.0
+
+# Cache for owner card names: (loaded_at, card names)
+_card_names_cache: Optional[Tuple[float, List[str]]] = None
+
+# Seconds cached categories are trusted; bounds staleness across Lambda instances
+CATEGORIES_CACHE_TTL_SECONDS = 60.0
+
+# Cache for categories: (loaded_at, categories sorted by created_at, by name)
+_categories_cache: Optional[Tuple[float, List[Category], Dict[str, Category]]] = None
 
 
 def _handle_error(error: ClientError, operation: str) -> None:
@@ -52,30 +86,83 @@ def _handle_error(error: ClientError, operation: str) -> None:
         raise RuntimeError(f"Database operation failed: {error_code}")
 
 
+def _is_condition_failure(error: ClientError) -> bool:
+    """Return True when a conditional write failed, e.g. the item does not exist."""
+    return error.response["Error"]["Code"] == "ConditionalCheckFailedException"
+
+
+def _query_all(max_items: Optional[int] = None, **kwargs) -> List[Dict]:
+    """Run a query and follow LastEvaluatedKey until every page is read.
+
+    With max_items, stop paging once that many items have been collected.
+    """
+    items: List[Dict] = []
+    while True:
+        if max_items is not None:
+            kwargs["Limit"] = max_items - len(items)
+        response = _get_table().query(**kwargs)
+        items.extend(response["Items"])
+        if "LastEvaluatedKey" not in response:
+            break
+        if max_items is not None and len(items) >= max_items:
+            break
+        kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+    return items
+
+
+def _query_entity_items(entity_type: str) -> List[Dict]:
+    """Query every item of one entity type from GSI2, oldest created first."""
+    return _query_all(
+        IndexName="GSI2", KeyConditionExpression=Key("EntityType").eq(entity_type)
+    )
+
+
+def _and_condition(current: Optional[ConditionBase], condition: ConditionBase):
+    """AND a condition onto an optional filter expression."""
+    return condition if current is None else current & condition
+
+
 def _invalidate_card_names_cache() -> None:
     """Invalidate the card names cache."""
     global _card_names_cache
     _card_names_cache = None
 
 
+def _invalidate_categories_cache() -> None:
+    """Invalidate the categories cache."""
+    global _categories_cache
+    _categories_cache = None
+
+
 # ============================================================================
 # OWNER OPERATIONS
 # ============================================================================
 
 
+def _item_to_owner(item: Dict) -> Owner:
+    """Convert DynamoDB item to Owner model (trusted data, skips validation)."""
+    return Owner.model_construct(
+        name=item["name"],
+        card_name=item["card_name"],
+        created_at=_parse_iso(item["created_at"]),
+    )
+
+
 def create_owner(owner_data: OwnerCreate) -> Optional[Owner]:
     """Create a new owner (immutable entity)."""
     owner = Owner(**owner_data.model_dump())
+    created_at = owner.created_at.isoformat()
 
     try:
-        _table.put_item(
+        _get_table().put_item(
             Item={
                 "PK": owner.get_pk(),
                 "SK": owner.get_sk(),
                 "EntityType": "Owner",
                 "name": owner.name,
                 "card_name": owner.card_name,
-                "created_at": owner.created_at.isoformat(),
+                "created_at": created_at,
+                "GSI2SK": created_at,
             },
             ConditionExpression="attribute_not_exists(PK)",
         )
@@ -89,15 +176,12 @@ def create_owner(owner_data: OwnerCreate) -> Optional[Owner]:
 def get_owner(name: str) -> Optional[Owner]:
     """Get owner by name."""
     try:
-        response = _table.get_item(Key={"PK": f"OWNER#{name}", "SK": f"OWNER#{name}"})
+        response = _get_table().get_item(
+            Key={"PK": f"OWNER#{name}", "SK": f"OWNER#{name}"}
+        )
 
         if "Item" in response:
-            item = response["Item"]
-            return Owner(
-                name=item["name"],
-                card_name=item["card_name"],
-                created_at=datetime.fromisoformat(item["created_at"]),
-            )
+            return _item_to_owner(response["Item"])
         return None
     except ClientError as e:
         _handle_error(e, "get owner")
@@ -106,20 +190,8 @@ def get_owner(name: str) -> Optional[Owner]:
 def list_owners() -> Optional[List[Owner]]:
     """List all owners."""
     try:
-        response = _table.scan(FilterExpression=Attr("EntityType").eq("Owner"))
-
-        owners = []
-        for item in response["Items"]:
-            owners.append(
-                Owner(
-                    name=item["name"],
-                    card_name=item["card_name"],
-                    created_at=datetime.fromisoformat(item["created_at"]),
-                )
-            )
-
-        owners.sort(key=lambda x: x.created_at)
-        return owners
+        # GSI2 sorts owners by created_at
+        return [_item_to_owner(item) for item in _query_entity_items("Owner")]
     except ClientError as e:
         _handle_error(e, "list owners")
 
@@ -128,16 +200,18 @@ def get_card_names() -> List[str]:
     """Get all card names from owners (cached)."""
     global _card_names_cache
 
-    if _card_names_cache is not None:
-        return _card_names_cache
+    now = time.monotonic()
+    if (
+        _card_names_cache is not None
+        and now - _card_names_cache[0] < CARD_NAMES_CACHE_TTL_SECONDS
+    ):
+        return _card_names_cache[1]
 
     owners = list_owners()
-    if not owners:
-        _card_names_cache = []
-    else:
-        _card_names_cache = [owner.card_name for owner in owners]
+    card_names = [owner.card_name for owner in owners] if owners else []
 
-    return _card_names_cache
+    _card_names_cache = (now, card_names)
+    return card_names
 
 
 # ============================================================================
@@ -145,16 +219,29 @@ def get_card_names() -> List[str]:
 # ============================================================================
 
 
+def _item_to_account(item: Dict) -> Account:
+    """Convert DynamoDB item to Account model (trusted data, skips validation)."""
+    return Account.model_construct(
+        account_name=item["account_name"],
+        bank_name=item["bank_name"],
+        owner_name=item["owner_name"],
+        card_member=item["card_member"],
+        active=item.get("active", True),
+        created_at=_parse_iso(item["created_at"]),
+    )
+
+
 def create_account(account_data: AccountCreate) -> Optional[Account]:
     """Create a new account."""
     account = Account(**account_data.model_dump())
+    created_at = account.created_at.isoformat()
 
     # Build GSI1 keys for querying accounts by owner
     gsi1_pk = f"OWNER#{account.owner_name}"
     gsi1_sk = f"ACCOUNT#{account.account_name}"
 
     try:
-        _table.put_item(
+        _get_table().put_item(
             Item={
                 "PK": account.get_pk(),
                 "SK": account.get_sk(),
@@ -164,9 +251,10 @@ def create_account(account_data: AccountCreate) -> Optional[Account]:
                 "owner_name": account.owner_name,
                 "card_member": account.card_member,
                 "active": account.active,
-                "created_at": account.created_at.isoformat(),
+                "created_at": created_at,
                 "GSI1PK": gsi1_pk,
                 "GSI1SK": gsi1_sk,
+                "GSI2SK": created_at,
             },
             ConditionExpression="attribute_not_exists(PK)",
         )
@@ -184,7 +272,7 @@ def get_account(account_id: str) -> Optional[Account]:
             return None
 
         account_name, owner_name = parts
-        response = _table.get_item(
+        response = _get_table().get_item(
             Key={
                 "PK": f"ACCOUNT#{account_name}#{owner_name}",
                 "SK": f"ACCOUNT#{account_name}#{owner_name}",
@@ -192,15 +280,7 @@ def get_account(account_id: str) -> Optional[Account]:
         )
 
         if "Item" in response:
-            item = response["Item"]
-            return Account(
-                account_name=item["account_name"],
-                bank_name=item["bank_name"],
-                owner_name=item["owner_name"],
-                card_member=item["card_member"],
-                active=item.get("active", True),
-                created_at=datetime.fromisoformat(item["created_at"]),
-            )
+            return _item_to_account(response["Item"])
         return None
     except ClientError as e:
         _handle_error(e, "get account")
@@ -211,62 +291,44 @@ def list_accounts(owner_name: Optional[str] = None) -> Optional[List[Account]]:
     try:
         if owner_name:
             # Use GSI1 to query accounts by owner
-            response = _table.query(
+            items = _query_all(
                 IndexName="GSI1",
                 KeyConditionExpression=Key("GSI1PK").eq(f"OWNER#{owner_name}")
                 & Key("GSI1SK").begins_with("ACCOUNT#"),
             )
-        else:
-            # Scan all accounts
-            response = _table.scan(FilterExpression=Attr("EntityType").eq("Account"))
-
-        accounts = []
-        for item in response["Items"]:
-            accounts.append(
-                Account(
-                    account_name=item["account_name"],
-                    bank_name=item["bank_name"],
-                    owner_name=item["owner_name"],
-                    card_member=item["card_member"],
-                    active=item.get("active", True),
-                    created_at=datetime.fromisoformat(item["created_at"]),
-                )
-            )
+            accounts = [_item_to_account(item) for item in items]
+            accounts.sort(key=attrgetter("created_at"))
+            return accounts
 
-        accounts.sort(key=lambda x: x.created_at)
-        return accounts
+        # GSI2 sorts accounts by created_at
+        return [_item_to_account(item) for item in _query_entity_items("Account")]
     except ClientError as e:
         _handle_error(e, "list accounts")
 
 
 def update_account(account_id: str, update_data: AccountUpdate) -> Optional[Account]:
     """Update account (active status only)."""
-    account = get_account(account_id)
-    if not account:
+    parts = account_id.split(" ", 1)
+    if len(parts) != 2:
         return None
 
-    pk = account.get_pk()
-    sk = account.get_sk()
+    # Update by key; the existence condition replaces a separate read
+    account_name, owner_name = parts
+    key = f"ACCOUNT#{account_name}#{owner_name}"
 
     try:
-        response = _table.update_item(
-            Key={"PK": pk, "SK": sk},
+        response = _get_table().update_item(
+            Key={"PK": key, "SK": key},
             UpdateExpression="SET active = :active",
             ExpressionAttributeValues={":active": update_data.active},
             ConditionExpression="attribute_exists(PK)",
             ReturnValues="ALL_NEW",
         )
 
-        item = response["Attributes"]
-        return Account(
-            account_name=item["account_name"],
-            bank_name=item["bank_name"],
-            owner_name=item["owner_name"],
-            card_member=item["card_member"],
-            active=item["active"],
-            created_at=datetime.fromisoformat(item["created_at"]),
-        )
+        return _item_to_account(response["Attributes"])
     except ClientError as e:
+        if _is_condition_failure(e):
+            return None
         _handle_error(e, "update account")
 
 
@@ -275,12 +337,25 @@ def update_account(account_id: str, update_data: AccountUpdate) -> Optional[Acco
 # ============================================================================
 
 
+def _item_to_category(item: Dict) -> Category:
+    """Convert DynamoDB item to Category model (trusted data, skips validation)."""
+    return Category.model_construct(
+        name=item["name"],
+        labels=list(item.get("labels", [])),
+        account_id=item["account_id"],
+        card_name=item["card_name"],
+        active=item.get("active", True),
+        created_at=_parse_iso(item["created_at"]),
+    )
+
+
 def create_category(category_data: CategoryCreate) -> Optional[Category]:
     """Create a new category."""
     category = Category(**category_data.model_dump())
+    created_at = category.created_at.isoformat()
 
     try:
-        _table.put_item(
+        _get_table().put_item(
             Item={
                 "PK": category.get_pk(),
                 "SK": category.get_sk(),
@@ -290,11 +365,13 @@ def create_category(category_data: CategoryCreate) -> Optional[Category]:
                 "account_id": category.account_id,
                 "card_name": category.card_name,
                 "active": category.active,
-                "created_at": category.created_at.isoformat(),
+                "created_at": created_at,
+                "GSI2SK": created_at,
             },
             ConditionExpression="attribute_not_exists(PK)",
         )
         logger.info(f"Created category: {category.name}")
+        _invalidate_categories_cache()
         return category
     except ClientError as e:
         _handle_error(e, "create category")
@@ -303,59 +380,67 @@ def create_category(category_data: CategoryCreate) -> Optional[Category]:
 def get_category(name: str) -> Optional[Category]:
     """Get category by name."""
     try:
-        response = _table.get_item(
+        response = _get_table().get_item(
             Key={"PK": f"CATEGORY#{name}", "SK": f"CATEGORY#{name}"}
         )
 
         if "Item" in response:
-            item = response["Item"]
-            return Category(
-                name=item["name"],
-                labels=item.get("labels", []),
-                account_id=item["account_id"],
-                card_name=item["card_name"],
-                active=item.get("active", True),
-                created_at=datetime.fromisoformat(item["created_at"]),
-            )
+            return _item_to_category(response["Item"])
         return None
     except ClientError as e:
         _handle_error(e, "get category")
 
 
-def list_categories(account_id: Optional[str] = None) -> Optional[List[Category]]:
-    """List all categories, optionally filtered by account."""
-    try:
-        response = _table.scan(FilterExpression=Attr("EntityType").eq("Category"))
-
-        categories = []
-        for item in response["Items"]:
-            category = Category(
-                name=item["name"],
-                labels=item.get("labels", []),
-                account_id=item["account_id"],
-                card_name=item["card_name"],
-                active=item.get("active", True),
-                created_at=datetime.fromisoformat(item["created_at"]),
-            )
+def _get_cached_categories() -> Tuple[List[Category], Dict[str, Category]]:
+    """Return all categories sorted by created_at and keyed by name (cached)."""
+    global _categories_cache
 
-            if account_id is None or category.account_id == account_id:
-                categories.append(category)
+    now = time.monotonic()
+    if (
+        _categories_cache is not None
+        and now - _categories_cache[0] < CATEGORIES_CACHE_TTL_SECONDS
+    ):
+        return _categories_cache[1], _categories_cache[2]
 
-        categories.sort(key=lambda x: x.created_at)
-        return categories
+    try:
+        # GSI2 sorts categories by created_at
+        items = _query_entity_items("Category")
     except ClientError as e:
         _handle_error(e, "list categories")
 
+    categories = [_item_to_category(item) for item in items]
+    categories_by_name = {category.name: category for category in categories}
 
-def update_category(name: str, update_data: CategoryUpdate) -> Optional[Category]:
-    """Update category (labels and active status only)."""
-    category = get_category(name)
-    if not category:
-        return None
+    _categories_cache = (now, categories, categories_by_name)
+    return categories, categories_by_name
+
+
+def get_category_cached(name: str) -> Optional[Category]:
+    """Get category by name from the categories cache.
+
+    Falls back to a direct read on a miss, so categories created by another
+    instance are found before the cache expires.
+    """
+    _, categories_by_name = _get_cached_categories()
+    category = categories_by_name.get(name)
+    if category is None:
+        category = get_category(name)
+    return category
+
+
+def list_categories(account_id: Optional[str] = None) -> Optional[List[Category]]:
+    """List all categories, optionally filtered by account (cached)."""
+    categories, _ = _get_cached_categories()
+
+    return [
+        category
+        for category in categories
+        if account_id is None or category.account_id == account_id
+    ]
 
-    pk = category.get_pk()
-    sk = category.get_sk()
 
+def update_category(name: str, update_data: CategoryUpdate) -> Optional[Category]:
+    """Update category (labels and active status only)."""
     # Build update expression
     update_expressions = []
     expression_values = {}
@@ -369,27 +454,23 @@ def update_category(name: str, update_data: CategoryUpdate) -> Optional[Category
         expression_values[":active"] = update_data.active
 
     if not update_expressions:
-        return category
+        return get_category(name)
 
     try:
-        response = _table.update_item(
-            Key={"PK": pk, "SK": sk},
+        # Update by key; the existence condition replaces a separate read
+        response = _get_table().update_item(
+            Key={"PK": f"CATEGORY#{name}", "SK": f"CATEGORY#{name}"},
             UpdateExpression=f"SET {', '.join(update_expressions)}",
             ExpressionAttributeValues=expression_values,
             ConditionExpression="attribute_exists(PK)",
             ReturnValues="ALL_NEW",
         )
 
-        item = response["Attributes"]
-        return Category(
-            name=item["name"],
-            labels=item.get("labels", []),
-            account_id=item["account_id"],
-            card_name=item["card_name"],
-            active=item["active"],
-            created_at=datetime.fromisoformat(item["created_at"]),
-        )
+        _invalidate_categories_cache()
+        return _item_to_category(response["Attributes"])
     except ClientError as e:
+        if _is_condition_failure(e):
+            return None
         _handle_error(e, "update category")
 
 
@@ -399,13 +480,25 @@ def update_category(name: str, update_data: CategoryUpdate) -> Optional[Category
 
 
 def _item_to_expense(item: Dict) -> Expense:
-    """Convert DynamoDB item to Expense model."""
-    return Expense(
+    """Convert DynamoDB item to Expense model (trusted data, skips validation).
+
+    Applies the defaults Expense's after-validator would set.
+    """
+    card_member = item["card_member"]
+    assigned_card_member = item.get("assigned_card_member")
+    if assigned_card_member is None:
+        assigned_card_member = card_member
+    is_auto_categorized = item.get("is_auto_categorized", False)
+    category_hint = item.get("category_hint")
+    if is_auto_categorized and category_hint is None:
+        category_hint = []
+
+    return Expense.model_construct(
         expense_id=item["expense_id"],
-        date=datetime.fromisoformat(item["date"]),
+        date=_parse_iso(item["date"]),
         description=item["description"],
-        card_member=item["card_member"],
-        assigned_card_member=item.get("assigned_card_member"),
+        card_member=card_member,
+        assigned_card_member=assigned_card_member,
         account_number=item.get("account_number"),
         account_id=item.get("account_id"),
         amount=Decimal(item["amount"]),
@@ -416,11 +509,11 @@ def _item_to_expense(item: Dict) -> Expense:
         zip_code=item.get("zip_code"),
         country=item.get("country"),
         reference=item.get("reference"),
-        category_hint=item.get("category_hint"),
+        category_hint=category_hint,
         category=item.get("category"),
-        is_auto_categorized=item.get("is_auto_categorized", False),
+        is_auto_categorized=is_auto_categorized,
         needs_review=item.get("needs_review", False),
-        created_at=datetime.fromisoformat(item["created_at"]),
+        created_at=_parse_iso(item["created_at"]),
     )
 
 
@@ -428,6 +521,11 @@ def _validate_card_member(card_member: str) -> None:
     """Validate that card_member exists in Owner entities."""
     valid_card_names = get_card_names()
 
+    # Owners created by another instance are not in this cache yet; re-read once
+    if card_member not in valid_card_names:
+        _invalidate_card_names_cache()
+        valid_card_names = get_card_names()
+
     if not valid_card_names:
         raise ValueError("No owners found in system")
 
@@ -437,17 +535,35 @@ def _validate_card_member(card_member: str) -> None:
         )
 
 
-def create_expense(expense_data: ExpenseCreate) -> Optional[Expense]:
-    """Create a new expense."""
-    expense = Expense(**expense_data.model_dump())
+# Expense fields stored only when set
+_EXPENSE_OPTIONAL_FIELDS = (
+    "account_number",
+    "account_id",
+    "extended_details",
+    "appears_on_statement_as",
+    "address",
+    "city_state",
+    "zip_code",
+    "country",
+    "reference",
+    "category_hint",
+)
 
-    # Prepare item for DynamoDB
+
+def _expense_to_item(expense: Expense) -> Dict:
+    """Convert Expense model to DynamoDB item."""
+    date = expense.date.isoformat()
     item = {
         "PK": expense.get_pk(),
         "SK": expense.get_sk(),
         "EntityType": "Expense",
+        # GSI1 keys enable expense_id prefix search
+        "GSI1PK": EXPENSE_GSI1PK,
+        "GSI1SK": expense.expense_id,
+        # GSI2 (EntityType, GSI2SK) orders expenses by date for range queries
+        "GSI2SK": date,
         "expense_id": expense.expense_id,
-        "date": expense.date.isoformat(),
+        "date": date,
         "description": expense.description,
         "card_member": expense.card_member,
         "assigned_card_member": expense.assigned_card_member,
@@ -458,19 +574,7 @@ def create_expense(expense_data: ExpenseCreate) -> Optional[Expense]:
     }
 
     # Add optional fields
-    optional_fields = [
-        "account_number",
-        "account_id",
-        "extended_details",
-        "appears_on_statement_as",
-        "address",
-        "city_state",
-        "zip_code",
-        "country",
-        "reference",
-        "category_hint",
-    ]
-    for field in optional_fields:
+    for field in _EXPENSE_OPTIONAL_FIELDS:
         value = getattr(expense, field)
         if value is not None:
             item[field] = value
@@ -479,18 +583,44 @@ def create_expense(expense_data: ExpenseCreate) -> Optional[Expense]:
     if expense.category:
         item["category"] = expense.category
 
+    return item
+
+
+def create_expense(expense_data: ExpenseCreate) -> Optional[Expense]:
+    """Create a new expense."""
+    return put_expense(Expense(**expense_data.model_dump()))
+
+
+def put_expense(expense: Expense) -> Optional[Expense]:
+    """Persist an already-validated expense without re-validating it."""
     try:
-        _table.put_item(Item=item)
+        _get_table().put_item(Item=_expense_to_item(expense))
         logger.info(f"Created expense: {expense.expense_id}")
         return expense
     except ClientError as e:
         _handle_error(e, "create expense")
 
 
+def put_expenses(expenses: List[Expense]) -> List[Expense]:
+    """Persist already-validated expenses with batched writes.
+
+    The batch writer sends up to BATCH_WRITE_MAX_ITEMS puts per request and
+    resubmits unprocessed items.
+    """
+    try:
+        with _get_table().batch_writer(overwrite_by_pkeys=["PK", "SK"]) as batch:
+            for expense in expenses:
+                batch.put_item(Item=_expense_to_item(expense))
+        logger.info(f"Created {len(expenses)} expenses")
+        return expenses
+    except ClientError as e:
+        _handle_error(e, "create expenses")
+
+
 def get_expense(expense_id: str) -> Optional[Expense]:
     """Get expense by ID using direct get_item."""
     try:
-        response = _table.get_item(
+        response = _get_table().get_item(
             Key={"PK": f"EXPENSE#{expense_id}", "SK": f"EXPENSE#{expense_id}"}
         )
 
@@ -504,75 +634,121 @@ def get_expense(expense_id: str) -> Optional[Expense]:
 def search_expenses_by_id_prefix(prefix: str) -> List[Expense]:
     """Search expenses whose IDs start with a prefix.
 
-    Performs a single table scan with a begins_with filter and caps
-    the response at 1,000 items. Pagination via LastEvaluatedKey is not
-    followed, so callers should treat the result as best-effort rather than
-    exhaustive when large datasets are present.
+    Queries the GSI1 expense partition with begins_with on the expense_id
+    sort key, so only matching items are read. Pages are followed until
+    SEARCH_RESULT_LIMIT items are collected.
     """
     if not prefix:
         return []
 
     try:
-        response = _table.scan(
-            FilterExpression=Attr("expense_id").begins_with(prefix), Limit=1000
+        items = _query_all(
+            max_items=SEARCH_RESULT_LIMIT,
+            IndexName="GSI1",
+            KeyConditionExpression=Key("GSI1PK").eq(EXPENSE_GSI1PK)
+            & Key("GSI1SK").begins_with(prefix),
         )
-        expenses = [_item_to_expense(item) for item in response["Items"]]
-        expenses.sort(key=lambda e: e.date, reverse=True)
+        expenses = [_item_to_expense(item) for item in items]
+        expenses.sort(key=attrgetter("date"), reverse=True)
         return expenses
     except ClientError as e:
         _handle_error(e, "search expenses by prefix")
         return []
 
 
-def list_expenses(expense_filter: ExpenseFilter) -> Optional[List[Expense]]:
-    """List expenses with filtering support (uses table scan)."""
-    try:
-        # Build filter expression - start with expense key prefix
-        filter_conditions = [Attr("PK").begins_with("EXPENSE#")]
+def _compile_item_predicate(
+    expense_filter: ExpenseFilter,
+) -> Optional[Callable[[Dict], bool]]:
+    """Build the in-memory part of an expense filter as a predicate on raw items.
 
-        if expense_filter.start_date:
-            filter_conditions.append(
-                Attr("date").gte(expense_filter.start_date.isoformat())
-            )
+    Returns None when DynamoDB's filter expression already covers the filter.
+    """
+    if not expense_filter.assigned_card_member:
+        return None
+
+    # DynamoDB filter is case-sensitive, so card members are compared normalized
+    normalized_filter = normalize_text(expense_filter.assigned_card_member)
+
+    def matches(item: Dict) -> bool:
+        return normalize_text(item.get("assigned_card_member")) == normalized_filter
+
+    return matches
+
+
+def list_expenses(
+    expense_filter: ExpenseFilter, attributes: Optional[Sequence[str]] = None
+) -> Optional[List[Expense]]:
+    """List expenses with filtering support (queries the GSI2 date index).
 
-        if expense_filter.end_date:
-            filter_conditions.append(
-                Attr("date").lte(expense_filter.end_date.isoformat())
+    When attributes is given, only those item attributes are read; it must
+    include the fields Expense requires (expense_id, date, description,
+    card_member, amount, created_at) and assigned_card_member when filtering
+    on it. Omitted optional fields come back as None.
+    """
+    try:
+        # Date range as a key condition on the GSI2 expense partition
+        key_condition = Key("EntityType").eq("Expense")
+        start_date = expense_filter.start_date
+        end_date = expense_filter.end_date
+        if start_date and end_date:
+            if start_date.isoformat() > end_date.isoformat():
+                return []  # DynamoDB rejects an inverted BETWEEN range
+            key_condition &= Key("GSI2SK").between(
+                start_date.isoformat(), end_date.isoformat()
             )
+        elif start_date:
+            key_condition &= Key("GSI2SK").gte(start_date.isoformat())
+        elif end_date:
+            key_condition &= Key("GSI2SK").lte(end_date.isoformat())
+
+        # Remaining filters are applied by DynamoDB to the queried items
+        filter_expr = None
 
         if expense_filter.account_id:
-            filter_conditions.append(Attr("account_id").eq(expense_filter.account_id))
+            filter_expr = _and_condition(
+                filter_expr, Attr("account_id").eq(expense_filter.account_id)
+            )
 
         if expense_filter.category:
-            filter_conditions.append(Attr("category").eq(expense_filter.category))
+            filter_expr = _and_condition(
+                filter_expr, Attr("category").eq(expense_filter.category)
+            )
 
         if expense_filter.assigned_card_member:
-            # DynamoDB filter is case-sensitive, will normalize in memory
-            filter_conditions.append(Attr("assigned_card_member").exists())
+            # Narrowed further by the in-memory predicate below
+            filter_expr = _and_condition(
+                filter_expr, Attr("assigned_card_member").exists()
+            )
 
         if expense_filter.needs_review is not None:
-            filter_conditions.append(
-                Attr("needs_review").eq(expense_filter.needs_review)
+            filter_expr = _and_condition(
+                filter_expr, Attr("needs_review").eq(expense_filter.needs_review)
             )
 
-        # Combine all conditions with AND
-        filter_expr = reduce(lambda a, b: a & b, filter_conditions)
-
-        # Scan table with filter
-        response = _table.scan(FilterExpression=filter_expr)
-        expenses = [_item_to_expense(item) for item in response["Items"]]
+        query_kwargs = {
+            "IndexName": "GSI2",
+            "KeyConditionExpression": key_condition,
+            "ScanIndexForward": False,
+        }
+        if filter_expr is not None:
+            query_kwargs["FilterExpression"] = filter_expr
+        if attributes:
+            # Placeholders avoid clashes with reserved words such as "date"
+            query_kwargs["ProjectionExpression"] = ", ".join(
+                f"#{name}" for name in attributes
+            )
+            query_kwargs["ExpressionAttributeNames"] = {
+                f"#{name}": name for name in attributes
+            }
+        items = _query_all(**query_kwargs)
 
-        # Handle normalized card_member filtering in memory
-        if expense_filter.assigned_card_member:
-            normalized_filter = normalize_text(expense_filter.assigned_card_member)
-            expenses = [
-                e
-                for e in expenses
-                if normalize_text(e.assigned_card_member) == normalized_filter
-            ]
+        # Apply in-memory filtering to raw items so rejected rows are never converted
+        item_predicate = _compile_item_predicate(expense_filter)
+        if item_predicate is not None:
+            items = [item for item in items if item_predicate(item)]
 
-        # Sort by date: newest to oldest
-        expenses.sort(key=lambda e: e.date, reverse=True)
+        # Already newest to oldest: GSI2 is queried in descending date order
+        expenses = [_item_to_expense(item) for item in items]
 
         logger.info(f"Retrieved {len(expenses)} expenses")
         return expenses
@@ -580,22 +756,60 @@ def list_expenses(expense_filter: ExpenseFilter) -> Optional[List[Expense]]:
         _handle_error(e, "list expenses")
 
 
-def update_expense(expense_id: str, update_data: ExpenseUpdate) -> Optional[Expense]:
-    """Update expense (assigned_card_member and category only)."""
-    from services.categorization_service import AutoCategorizationService
+def backfill_index_keys() -> int:
+    """Add missing GSI key attributes to items written before those indexes.
 
-    # First find the expense to get its PK/SK
-    expense = get_expense(expense_id)
-    if not expense:
-        return None
+    Expenses get GSI1 (expense_id) and GSI2 (date) keys; owners, accounts and
+    categories get a GSI2 (created_at) key. Run once after deploying the
+    indexes; returns the number of items updated.
+    """
+    updated = 0
+    scan_kwargs = {"FilterExpression": Attr("EntityType").exists()}
+    try:
+        while True:
+            response = _get_table().scan(**scan_kwargs)
+            for item in response["Items"]:
+                if item["EntityType"] == "Expense":
+                    if "GSI1PK" in item and "GSI2SK" in item:
+                        continue
+                    update_expression = (
+                        "SET GSI1PK = :gsi1pk, GSI1SK = :gsi1sk, GSI2SK = :gsi2sk"
+                    )
+                    expression_values = {
+                        ":gsi1pk": EXPENSE_GSI1PK,
+                        ":gsi1sk": item["expense_id"],
+                        ":gsi2sk": item["date"],
+                    }
+                elif item["EntityType"] in ("Owner", "Account", "Category"):
+                    if "GSI2SK" in item:
+                        continue
+                    update_expression = "SET GSI2SK = :gsi2sk"
+                    expression_values = {":gsi2sk": item["created_at"]}
+                else:
+                    continue
+
+                _get_table().update_item(
+                    Key={"PK": item["PK"], "SK": item["SK"]},
+                    UpdateExpression=update_expression,
+                    ExpressionAttributeValues=expression_values,
+                )
+                updated += 1
+            if "LastEvaluatedKey" not in response:
+                break
+            scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+    except ClientError as e:
+        _handle_error(e, "backfill index keys")
+
+    logger.info(f"Backfilled index keys on {updated} items")
+    return updated
 
+
+def _build_expense_update(update_data: ExpenseUpdate) -> Tuple[List[str], Dict]:
+    """Validate an expense update and build its SET clauses and values."""
     # Validate assigned_card_member if provided
     if update_data.assigned_card_member is not None:
         _validate_card_member(update_data.assigned_card_member)
 
-    pk = expense.get_pk()
-    sk = expense.get_sk()
-
     # Build update expression
     update_expressions = []
     expression_values = {}
@@ -603,24 +817,22 @@ def update_expense(expense_id: str, update_data: ExpenseUpdate) -> Optional[Expe
     # Handle category update with automatic assigned_card_member update
     if update_data.category is not None:
         # Look up the new category to get its account_id
-        new_category = get_category(update_data.category)
+        new_category = get_category_cached(update_data.category)
         if not new_category:
             raise ValueError(f"Category '{update_data.category}' not found")
 
         # Update assigned_card_member based on new category's card_name
-        categorization_service = AutoCategorizationService()
-        updated_expense = categorization_service.update_expense_assigned_card_member_on_category_change(
-            expense, update_data.category
-        )
+        if not new_category.card_name:
+            raise ValueError(f"Category '{update_data.category}' has no card_name")
+        if not new_category.account_id:
+            raise ValueError(f"Category '{update_data.category}' has no account_id")
 
         update_expressions.append("category = :category")
         update_expressions.append("assigned_card_member = :assigned_card_member")
         update_expressions.append("account_id = :account_id")
         update_expressions.append("needs_review = :needs_review")
         expression_values[":category"] = update_data.category
-        expression_values[":assigned_card_member"] = (
-            updated_expense.assigned_card_member
-        )
+        expression_values[":assigned_card_member"] = new_category.card_name
         expression_values[":account_id"] = new_category.account_id
         expression_values[":needs_review"] = False
 
@@ -629,12 +841,26 @@ def update_expense(expense_id: str, update_data: ExpenseUpdate) -> Optional[Expe
         update_expressions.append("assigned_card_member = :assigned_card_member")
         expression_values[":assigned_card_member"] = update_data.assigned_card_member
 
+    return update_expressions, expression_values
+
+
+def update_expense(expense_id: str, update_data: ExpenseUpdate) -> Optional[Expense]:
+    """Update expense (assigned_card_member and category only)."""
+    try:
+        update_expressions, expression_values = _build_expense_update(update_data)
+    except ValueError:
+        # A missing expense is reported as not found ahead of invalid input
+        if get_expense(expense_id) is None:
+            return None
+        raise
+
     if not update_expressions:
-        return expense
+        return get_expense(expense_id)
 
     try:
-        response = _table.update_item(
-            Key={"PK": pk, "SK": sk},
+        # Update by key; the existence condition replaces a separate read
+        response = _get_table().update_item(
+            Key={"PK": f"EXPENSE#{expense_id}", "SK": f"EXPENSE#{expense_id}"},
             UpdateExpression=f"SET {', '.join(update_expressions)}",
             ExpressionAttributeValues=expression_values,
             ConditionExpression="attribute_exists(PK)",
@@ -643,21 +869,22 @@ def update_expense(expense_id: str, update_data: ExpenseUpdate) -> Optional[Expe
 
         return _item_to_expense(response["Attributes"])
     except ClientError as e:
+        if _is_condition_failure(e):
+            return None
         _handle_error(e, "update expense")
 
 
 def delete_expense(expense_id: str) -> Optional[bool]:
     """Delete expense by ID."""
-    expense = get_expense(expense_id)
-    if not expense:
-        return False
-
     try:
-        _table.delete_item(
-            Key={"PK": expense.get_pk(), "SK": expense.get_sk()},
+        # Delete by key; the existence condition replaces a separate read
+        _get_table().delete_item(
+            Key={"PK": f"EXPENSE#{expense_id}", "SK": f"EXPENSE#{expense_id}"},
             ConditionExpression="attribute_exists(PK)",
         )
         logger.info(f"Deleted expense: {expense_id}")
         return True
     except ClientError as e:
+        if _is_condition_failure(e):
+            return False
         _handle_error(e, "delete expense")
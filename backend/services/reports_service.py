@@ -68,7 +68,7 @@ class ReportsService:
             # Get expenses based on filter
             expenses = db.list_expenses(expense_filter)
             if not expenses:
-                return ExpensesByAccountReport(
+                return ExpensesByAccountReport.model_construct(
                     start_date=expense_filter.start_date,
                     end_date=expense_filter.end_date,
                     total_amount=Decimal("0"),
@@ -88,36 +88,36 @@ class ReportsService:
                     continue
 
                 account_id = expense.account_id
-
-                # Parse account_id to extract account_name and owner_name
-                # Format: "account_name owner_name" (space-separated)
-                # Use rsplit to split from the right since owner_name has no spaces
-                parts = account_id.rsplit(" ", 1)
-                if len(parts) != 2:
-                    logger.warning(
-                        f"Invalid account_id format '{account_id}' for expense {expense.expense_id}, skipping"
-                    )
-                    continue
-
-                account_name, owner_name = parts
-
-                if account_id not in grouped_expenses:
-                    grouped_expenses[account_id] = {
+                group = grouped_expenses.get(account_id)
+
+                if group is None:
+                    # Parse account_id to extract account_name and owner_name
+                    # Format: "account_name owner_name" (space-separated)
+                    # Use rsplit to split from the right since owner_name has no spaces
+                    parts = account_id.rsplit(" ", 1)
+                    if len(parts) != 2:
+                        logger.warning(
+                            f"Invalid account_id format '{account_id}' for expense {expense.expense_id}, skipping"
+                        )
+                        continue
+
+                    account_name, owner_name = parts
+                    group = grouped_expenses[account_id] = {
                         "account_name": account_name,
                         "owner_name": owner_name,
                         "expenses": [],
                         "total_amount": Decimal("0"),
                     }
 
-                grouped_expenses[account_id]["expenses"].append(expense)
+                group["expenses"].append(expense)
 
                 # Only sum positive amounts (actual expenses)
                 # Negative amounts are payments made to the card, not expenses to be tracked
                 if expense.amount > 0:
-                    grouped_expenses[account_id]["total_amount"] += expense.amount
+                    group["total_amount"] += expense.amount
                     # Exclude Card-Payments account from grand total
                     # Card-Payments is used to track payments made to credit cards, not actual expenses
-                    if account_name != "Card-Payments":
+                    if group["account_name"] != "Card-Payments":
                         total_amount += expense.amount
 
             # Create account groups
@@ -131,11 +131,11 @@ class ReportsService:
                 if account_name == "Card-Payments":
                     continue
 
-                # Sort expenses by date descending (newest first)
-                sorted_expenses = sorted(
-                    data["expenses"], key=lambda x: x.date, reverse=True
-                )
-                group = AccountExpenseGroup(
+                # list_expenses returns newest first, so each group is already
+                # sorted by date descending
+                sorted_expenses = data["expenses"]
+                # Built from validated expenses and computed totals; skip validation
+                group = AccountExpenseGroup.model_construct(
                     account_id=account_id,
                     account_name=account_name,
                     owner_name=owner_name,
@@ -148,7 +148,7 @@ class ReportsService:
             # Sort by owner name, then by total amount descending within each owner
             account_groups.sort(key=lambda x: (x.owner_name, -x.total_amount))
 
-            return ExpensesByAccountReport(
+            return ExpensesByAccountReport.model_construct(
                 start_date=expense_filter.start_date,
                 end_date=expense_filter.end_date,
                 total_amount=total_amount,
@@ -6,12 +6,38 @@ Encapsulates: validation (pre-done by csv_service), parsing, optional auto-categ
 
 from __future__ import annotations
 
-from typing import List, Tuple
+from datetime import UTC, datetime
+from io import StringIO
+from typing import Iterable, List, Optional, Tuple
 
 from core.models import Expense, ExpenseCreate
 from services import dynamo_expenses as db
-from services.categorization_service import AutoCategorizationService
-from services.csv_service import parse_csv_expenses
+from services.categorization_service import (
+    AutoCategorizationService,
+    HistoricalIndex,
+)
+from services.csv_service import parse_csv_stream
+
+
+def _drop_duplicate_references(
+    expenses: List[ExpenseCreate],
+) -> Tuple[List[ExpenseCreate], int]:
+    """Keep only the last row for each statement reference, in file order.
+
+    Re-downloaded bank exports can repeat a transaction; rows without a
+    reference are always kept. Returns the kept rows and how many were dropped.
+    """
+    last_row = {
+        expense.reference: index
+        for index, expense in enumerate(expenses)
+        if expense.reference
+    }
+    kept = [
+        expense
+        for index, expense in enumerate(expenses)
+        if not expense.reference or last_row[expense.reference] == index
+    ]
+    return kept, len(expenses) - len(kept)
 
 
 class UploadProcessingService:
@@ -24,26 +50,68 @@ class UploadProcessingService:
     def __init__(self):
         self.categorization = AutoCategorizationService()
 
-    def process_csv_text(self, csv_text: str) -> Tuple[int, int, int, List[str]]:
+    def process_csv_text(self, csv_text: str) -> Tuple[int, int, int, int, List[str]]:
         """Process CSV text and persist expenses.
 
         Returns:
-            processed_count, auto_categorized_count, needs_review_count, all_errors
+            processed_count, auto_categorized_count, needs_review_count,
+            duplicate_count, all_errors
+        """
+        return self.process_csv_stream(StringIO(csv_text))
+
+    def process_csv_stream(
+        self, csv_stream: Iterable[str]
+    ) -> Tuple[int, int, int, int, List[str]]:
+        """Process CSV rows read from a text stream and persist expenses.
+
+        Returns:
+            processed_count, auto_categorized_count, needs_review_count,
+            duplicate_count, all_errors
         """
-        expenses, parsing_errors = parse_csv_expenses(csv_text)
+        expenses, parsing_errors = parse_csv_stream(csv_stream)
+        if not expenses:
+            # Nothing to categorize or write
+            return 0, 0, 0, 0, parsing_errors
+        expenses, duplicate_count = _drop_duplicate_references(expenses)
 
         processed_count = 0
         auto_categorized_count = 0
         needs_review_count = 0
         processing_errors: List[str] = []
+        pending: List[Expense] = []
+        history: Optional[HistoricalIndex] = None
+        # One timestamp for the whole upload instead of one clock read per row
+        created_at = datetime.now(UTC)
+
+        def flush() -> int:
+            """Write pending expenses as one batch and return how many were saved."""
+            batch = pending[:]
+            pending.clear()
+            try:
+                db.put_expenses(batch)
+                return len(batch)
+            except Exception as e:  # pragma: no cover - robust error aggregation
+                processing_errors.append(
+                    f"Failed to create {len(batch)} expenses: {str(e)}"
+                )
+                return 0
 
         for expense_data in expenses:
             try:
-                expense = Expense(**expense_data.model_dump())
+                # Rows were validated while parsing; build the Expense directly,
+                # applying the defaults its validator would set
+                expense = Expense.model_construct(
+                    **expense_data.__dict__, created_at=created_at
+                )
+                if expense.assigned_card_member is None:
+                    expense.assigned_card_member = expense.card_member
 
                 # Apply auto-categorization if no category was provided in CSV
                 if not expense.category:
-                    expense = self.categorization.categorize_expense(expense)
+                    # Load categorization history once per upload
+                    if history is None:
+                        history = self.categorization.load_history()
+                    expense = self.categorization.categorize_expense(expense, history)
                     if expense.is_auto_categorized:
                         auto_categorized_count += 1
                     if expense.needs_review:
@@ -52,13 +120,21 @@ class UploadProcessingService:
                     # Ensure category_hint present as list if category manually provided
                     expense.category_hint = expense.category_hint or []
 
-                # Persist
-                _ = db.create_expense(
-                    ExpenseCreate(**expense.model_dump(exclude={"expense_id"}))
-                )
-                processed_count += 1
+                # Persist validated expenses as-is, a full batch at a time
+                pending.append(expense)
+                if len(pending) >= db.BATCH_WRITE_MAX_ITEMS:
+                    processed_count += flush()
             except Exception as e:  # pragma: no cover - robust error aggregation
                 processing_errors.append(f"Failed to create expense: {str(e)}")
 
+        if pending:
+            processed_count += flush()
+
         all_errors = parsing_errors + processing_errors
-        return processed_count, auto_categorized_count, needs_review_count, all_errors
+        return (
+            processed_count,
+            auto_categorized_count,
+            needs_review_count,
+            duplicate_count,
+            all_errors,
+        )
@@ -29,6 +29,16 @@ def test_db():
             pass  # Table might not exist
 
 
+@pytest.fixture(scope="session")
+def client():
+    """Create a test client shared by all API tests."""
+    from fastapi.testclient import TestClient
+
+    from local_main import app
+
+    return TestClient(app)
+
+
 @pytest.fixture
 def clean_db(test_db):
     """Provide a clean database for each test."""
@@ -36,8 +46,15 @@ def clean_db(test_db):
 
     # Clear all items from table
     response = table.scan()
-    for item in response["Items"]:
-        table.delete_item(Key={"PK": item["PK"], "SK": item["SK"]})
+    with table.batch_writer() as batch:
+        for item in response["Items"]:
+            batch.delete_item(Key={"PK": item["PK"], "SK": item["SK"]})
+
+    # Items were removed behind the service layer, so drop its caches
+    from services import dynamo_expenses
+
+    dynamo_expenses._invalidate_card_names_cache()
+    dynamo_expenses._invalidate_categories_cache()
 
     yield table
 
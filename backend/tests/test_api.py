@@ -1,13 +1,4 @@
 import pytest
-from fastapi.testclient import TestClient
-
-from local_main import app
-
-
-@pytest.fixture
-def client():
-    """Create test client."""
-    return TestClient(app)
 
 
 @pytest.fixture
@@ -119,6 +110,33 @@ class TestCategoryAPI:
         data = response.json()
         assert len(data) >= 1
 
+    def test_update_category_labels_cleans_labels(
+        self,
+        client,
+        auth_headers,
+        sample_owner_data,
+        sample_account_data,
+        sample_category_data,
+    ):
+        """Test updated labels are stripped and blank labels dropped."""
+        # Setup
+        client.post("/owners", json=sample_owner_data, headers=auth_headers)
+        client.post("/accounts", json=sample_account_data, headers=auth_headers)
+        client.post("/categories", json=sample_category_data, headers=auth_headers)
+
+        # Test
+        response = client.patch(
+            "/categories/TestCategory/labels",
+            json={"labels": ["  tea  ", "", "   "]},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 200
+        assert response.json()["labels"] == ["tea"]
+
+        response = client.get("/categories/TestCategory", headers=auth_headers)
+        assert response.json()["labels"] == ["tea"]
+
 
 class TestExpenseAPI:
     def test_create_expense(self, client, auth_headers):
@@ -156,6 +174,69 @@ class TestExpenseAPI:
         data = response.json()
         assert len(data) >= 1
 
+    def test_list_expenses_by_assigned_card_member(
+        self, client, auth_headers, clean_db
+    ):
+        """Test the assigned_card_member filter matches case-insensitively."""
+        for assigned_card_member in ("J DOE", "A SMITH"):
+            expense_data = {
+                "date": "2025-09-21T00:00:00",
+                "description": "Filtered Expense",
+                "card_member": "J DOE",
+                "assigned_card_member": assigned_card_member,
+                "amount": "10.00",
+            }
+            client.post("/expenses", json=expense_data, headers=auth_headers)
+
+        response = client.get(
+            "/expenses?assigned_card_member=j%20doe", headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [expense["assigned_card_member"] for expense in data] == ["J DOE"]
+
+    def test_search_expenses_by_id_prefix(self, client, auth_headers):
+        """Test searching expenses by expense_id prefix."""
+        expense_data = {
+            "date": "2025-09-21T00:00:00",
+            "description": "Searchable Expense",
+            "card_member": "Test User",
+            "amount": "12.00",
+        }
+        created = client.post("/expenses", json=expense_data, headers=auth_headers)
+        expense_id = created.json()["expense_id"]
+
+        response = client.get(
+            f"/expenses/search?prefix={expense_id[:8]}", headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        assert expense_id in [expense["expense_id"] for expense in response.json()]
+
+    def test_search_expenses_prefix_too_short(self, client, auth_headers):
+        """Test short prefixes are rejected."""
+        response = client.get("/expenses/search?prefix=ab", headers=auth_headers)
+
+        assert response.status_code == 400
+
+    def test_delete_expense(self, client, auth_headers):
+        """Test deleting an expense, then deleting it again."""
+        expense_data = {
+            "date": "2025-09-21T00:00:00",
+            "description": "Deleted Expense",
+            "card_member": "Test User",
+            "amount": "3.00",
+        }
+        created = client.post("/expenses", json=expense_data, headers=auth_headers)
+        expense_id = created.json()["expense_id"]
+
+        response = client.delete(f"/expenses/{expense_id}", headers=auth_headers)
+        assert response.status_code == 204
+
+        response = client.delete(f"/expenses/{expense_id}", headers=auth_headers)
+        assert response.status_code == 404
+
 
 class TestExpenseAssignedCardMemberAPI:
     @pytest.fixture
@@ -261,6 +342,25 @@ class TestExpenseAssignedCardMemberAPI:
 
         assert response.status_code == 404
 
+    @pytest.mark.parametrize(
+        "update_data",
+        [
+            {"category": "JohnSpend"},
+            {"category": "Missing Category"},
+            {"assigned_card_member": "J Doe"},
+            {"assigned_card_member": "Invalid Card Name"},
+        ],
+    )
+    def test_update_expense_not_found(
+        self, client, auth_headers, setup_owners_and_categories, update_data
+    ):
+        """Test a missing expense is reported as not found before invalid input."""
+        response = client.patch(
+            "/expenses/non-existent-id", json=update_data, headers=auth_headers
+        )
+
+        assert response.status_code == 404
+
     def test_category_update_also_updates_assigned_card_member(
         self, client, auth_headers, setup_owners_and_categories
     ):
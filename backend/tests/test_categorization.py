@@ -160,6 +160,35 @@ class TestAutoCategorizationService:
         historical_category = categorization_service._find_historical_match(new_expense)
         assert historical_category is None
 
+    def test_categorize_expenses_batch_uses_history_tolerance(
+        self, categorization_service, sample_categories, clean_db
+    ):
+        """Test batch categorization matches history within the amount tolerance."""
+        db.create_expense(
+            ExpenseCreate(
+                date=datetime.now() - timedelta(days=30),
+                description="Starbucks Coffee, Store",
+                card_member="T Owner",
+                amount=Decimal("5.50"),
+                category="Apple",
+            )
+        )
+
+        new_expenses = [
+            Expense(
+                date=datetime.now(),
+                description="STARBUCKS COFFEE STORE",
+                card_member="T Owner",
+                amount=amount,
+            )
+            for amount in (Decimal("5.49"), Decimal("5.60"))
+        ]
+
+        results = categorization_service.categorize_expenses(new_expenses)
+
+        # Within 0.01 matches history; otherwise the label match applies
+        assert [result.category for result in results] == ["Apple", "Coffee"]
+
     def test_historical_no_match_too_old(
         self, categorization_service, sample_categories, clean_db
     ):
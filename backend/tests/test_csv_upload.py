@@ -1,7 +1,6 @@
 import importlib.util
 
 import pytest
-from fastapi.testclient import TestClient
 
 # Skip these tests if python-multipart is not installed
 if importlib.util.find_spec("multipart") is None:  # pragma: no cover - env dependent
@@ -9,16 +8,9 @@ if importlib.util.find_spec("multipart") is None:  # pragma: no cover - env depe
         "python-multipart not installed; skipping upload tests", allow_module_level=True
     )
 
-from local_main import app
 from services.csv_service import parse_csv_expenses, validate_csv_file
 
 
-@pytest.fixture
-def client():
-    """Create test client."""
-    return TestClient(app)
-
-
 @pytest.fixture
 def sample_csv_content():
     """Sample CSV content for testing."""
@@ -59,6 +51,36 @@ class TestCSVService:
         assert len(errors) > 0
         assert "Missing required CSV headers" in errors[0]
 
+    def test_parse_csv_single_digit_date_and_invalid_amount(self):
+        """Test day/month without zero padding parse and bad amounts are reported."""
+        csv_content = """Date,Description,Card Member,Amount
+1/9/2025,Valid Row,J DOE,"$1,234.50"
+02/09/2025,Bad Amount,J DOE,abc"""
+        expenses, errors = parse_csv_expenses(csv_content)
+
+        assert len(expenses) == 1
+        assert expenses[0].date.day == 1
+        assert expenses[0].date.month == 9
+        assert str(expenses[0].amount) == "1234.50"
+        assert errors == ["Row 3: Invalid amount format 'abc'"]
+
+    def test_parse_csv_rejects_non_finite_amounts(self):
+        """Test NaN and Infinity amounts are reported instead of stored."""
+        csv_content = """Date,Description,Card Member,Amount
+01/09/2025,Valid Row,J DOE,10.00
+02/09/2025,Not A Number,J DOE,NaN
+03/09/2025,Infinite,J DOE,Infinity
+04/09/2025,Negative Infinite,J DOE,-inf"""
+        expenses, errors = parse_csv_expenses(csv_content)
+
+        assert len(expenses) == 1
+        assert expenses[0].description == "Valid Row"
+        assert errors == [
+            "Row 3: Invalid amount format 'NaN'",
+            "Row 4: Invalid amount format 'Infinity'",
+            "Row 5: Invalid amount format '-inf'",
+        ]
+
     def test_validate_csv_file_size(self):
         """Test CSV file size validation."""
         large_content = "x" * (600 * 1024)  # 600KB
@@ -87,6 +109,42 @@ class TestCSVUploadAPI:
         assert data["processed_count"] == 2
         assert data["error_count"] == 0
 
+    def test_upload_csv_spanning_multiple_batches(
+        self, client, setup_unknown_categories
+    ):
+        """Test uploads larger than one write batch persist every row."""
+        rows = [
+            f"{day % 28 + 1:02d}/09/2025,MERCHANT {day},J DOE,{day}.00"
+            for day in range(30)
+        ]
+        csv_content = "Date,Description,Card Member,Amount\n" + "\n".join(rows)
+
+        files = {"file": ("batches.csv", csv_content.encode("utf-8"), "text/csv")}
+        response = client.post("/expenses/upload", files=files)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["processed_count"] == 30
+        assert data["error_count"] == 0
+        assert len(client.get("/expenses").json()) == 30
+
+    def test_upload_skips_duplicate_references(self, client, setup_unknown_categories):
+        """Test rows repeating a statement reference are written once."""
+        csv_content = """Date,Description,Card Member,Amount,Reference
+21/09/2025,COFFEE SHOP,J DOE,5.50,REF1
+21/09/2025,COFFEE SHOP,J DOE,5.50,REF1
+22/09/2025,BAKERY,J DOE,3.00,"""
+
+        files = {"file": ("dupes.csv", csv_content.encode("utf-8"), "text/csv")}
+        response = client.post("/expenses/upload", files=files)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["processed_count"] == 2
+        assert data["duplicate_count"] == 1
+        assert "1 duplicates skipped" in data["message"]
+        assert len(client.get("/expenses").json()) == 2
+
     def test_upload_invalid_file_type(self, client):
         """Test uploading non-CSV file."""
         files = {"file": ("test.txt", b"not a csv", "text/plain")}
@@ -105,6 +163,27 @@ class TestCSVUploadAPI:
         assert data["success"] is False
         assert "File is empty" in data["errors"][0]
 
+    def test_upload_rejects_oversized_body(self, client):
+        """Test oversized uploads are rejected from Content-Length."""
+        large_csv = b"x" * (600 * 1024)  # 600KB
+        files = {"file": ("large.csv", large_csv, "text/csv")}
+        response = client.post("/expenses/upload", files=files)
+
+        assert response.status_code == 413
+        assert "too large" in response.json()["detail"]
+
+    def test_upload_non_utf8_csv(self, client):
+        """Test uploading a CSV that is not UTF-8 encoded."""
+        latin1_csv = "Date,Description,Card Member,Amount\n21/09/2025,Café,J DOE,1.00"
+        files = {"file": ("latin1.csv", latin1_csv.encode("latin-1"), "text/csv")}
+        response = client.post("/expenses/upload", files=files)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] is False
+        assert data["processed_count"] == 0
+        assert "File must be UTF-8 encoded" in data["errors"]
+
     def test_upload_csv_with_invalid_dates(self, client):
         """Test uploading CSV with invalid date format."""
         invalid_csv = """Date,Description,Card Member,Amount
@@ -0,0 +1,168 @@
+from datetime import datetime
+
+from boto3.dynamodb.conditions import Key
+
+from core.database import InMemoryDynamoTable
+
+
+def _account_item(account_name: str, owner_name: str) -> dict:
+    return {
+        "PK": f"ACCOUNT#{account_name}#{owner_name}",
+        "SK": f"ACCOUNT#{account_name}#{owner_name}",
+        "account_name": account_name,
+        "GSI1PK": f"OWNER#{owner_name}",
+        "GSI1SK": f"ACCOUNT#{account_name}",
+    }
+
+
+class TestInMemoryDynamoTableQuery:
+    def test_query_gsi_returns_items_sorted_by_range_key(self):
+        """Test GSI queries only touch the partition and return range-key order."""
+        table = InMemoryDynamoTable("test-query")
+        table.put_item(Item=_account_item("Zeta", "Alice"))
+        table.put_item(Item=_account_item("Alpha", "Alice"))
+        table.put_item(Item=_account_item("Beta", "Bob"))
+
+        response = table.query(
+            IndexName="GSI1",
+            KeyConditionExpression=Key("GSI1PK").eq("OWNER#Alice")
+            & Key("GSI1SK").begins_with("ACCOUNT#"),
+        )
+
+        assert [item["account_name"] for item in response["Items"]] == [
+            "Alpha",
+            "Zeta",
+        ]
+
+    def test_query_descending(self):
+        """Test ScanIndexForward=False reverses the range-key order."""
+        table = InMemoryDynamoTable("test-query-desc")
+        table.put_item(Item=_account_item("Alpha", "Alice"))
+        table.put_item(Item=_account_item("Zeta", "Alice"))
+
+        response = table.query(
+            IndexName="GSI1",
+            KeyConditionExpression=Key("GSI1PK").eq("OWNER#Alice"),
+            ScanIndexForward=False,
+        )
+
+        assert [item["account_name"] for item in response["Items"]] == [
+            "Zeta",
+            "Alpha",
+        ]
+
+    def test_index_tracks_updates_and_deletes(self):
+        """Test index entries follow update_item and delete_item."""
+        table = InMemoryDynamoTable("test-query-mutations")
+        item = _account_item("Alpha", "Alice")
+        table.put_item(Item=item)
+
+        table.update_item(
+            Key={"PK": item["PK"], "SK": item["SK"]},
+            UpdateExpression="SET GSI1PK = :owner",
+            ExpressionAttributeValues={":owner": "OWNER#Bob"},
+        )
+        alice = table.query(
+            IndexName="GSI1", KeyConditionExpression=Key("GSI1PK").eq("OWNER#Alice")
+        )
+        bob = table.query(
+            IndexName="GSI1", KeyConditionExpression=Key("GSI1PK").eq("OWNER#Bob")
+        )
+        assert alice["Count"] == 0
+        assert bob["Count"] == 1
+
+        table.delete_item(Key={"PK": item["PK"], "SK": item["SK"]})
+        bob = table.query(
+            IndexName="GSI1", KeyConditionExpression=Key("GSI1PK").eq("OWNER#Bob")
+        )
+        assert bob["Count"] == 0
+
+    def test_query_projection_returns_only_named_attributes(self):
+        """Test projections return only named attributes, resolving placeholders."""
+        table = InMemoryDynamoTable("test-query-projection")
+        table.put_item(Item=_account_item("Alpha", "Alice"))
+
+        response = table.query(
+            IndexName="GSI1",
+            KeyConditionExpression=Key("GSI1PK").eq("OWNER#Alice"),
+            ProjectionExpression="#name, PK",
+            ExpressionAttributeNames={"#name": "account_name"},
+        )
+
+        assert response["Items"] == [
+            {"account_name": "Alpha", "PK": "ACCOUNT#Alpha#Alice"}
+        ]
+
+
+class TestInMemoryBatchWriter:
+    def test_batch_writer_applies_puts_on_exit(self):
+        """Test buffered puts land on exit and duplicate keys keep the last write."""
+        table = InMemoryDynamoTable("test-batch-writer")
+        item = _account_item("Alpha", "Alice")
+
+        with table.batch_writer(overwrite_by_pkeys=["PK", "SK"]) as batch:
+            batch.put_item(Item=item)
+            batch.put_item(Item={**item, "account_name": "Renamed"})
+            batch.put_item(Item=_account_item("Beta", "Alice"))
+            assert table.scan()["Count"] == 0
+
+        response = table.query(
+            IndexName="GSI1", KeyConditionExpression=Key("GSI1PK").eq("OWNER#Alice")
+        )
+        assert [item["account_name"] for item in response["Items"]] == [
+            "Renamed",
+            "Beta",
+        ]
+
+
+class TestExpenseIndexKeys:
+    def test_backfill_makes_legacy_expenses_listable(self, clean_db):
+        """Test expenses stored without index keys are listed after the backfill."""
+        from core.models import ExpenseFilter
+        from services import dynamo_expenses as db
+
+        clean_db.put_item(
+            Item={
+                "PK": "EXPENSE#legacy-1",
+                "SK": "EXPENSE#legacy-1",
+                "EntityType": "Expense",
+                "expense_id": "legacy-1",
+                "date": "2025-09-21T00:00:00",
+                "description": "Legacy Expense",
+                "card_member": "J DOE",
+                "amount": "5.00",
+                "created_at": "2025-09-21T00:00:00",
+            }
+        )
+        september = ExpenseFilter(
+            start_date=datetime(2025, 9, 1), end_date=datetime(2025, 9, 30)
+        )
+        assert db.list_expenses(september) == []
+
+        assert db.backfill_index_keys() == 1
+
+        assert [e.expense_id for e in db.list_expenses(september)] == ["legacy-1"]
+        assert [e.expense_id for e in db.search_expenses_by_id_prefix("legacy")] == [
+            "legacy-1"
+        ]
+        assert db.backfill_index_keys() == 0
+
+    def test_backfill_makes_legacy_owners_listable(self, clean_db):
+        """Test owners stored without a created_at index key are listed after backfill."""
+        from services import dynamo_expenses as db
+
+        clean_db.put_item(
+            Item={
+                "PK": "OWNER#Legacy",
+                "SK": "OWNER#Legacy",
+                "EntityType": "Owner",
+                "name": "Legacy",
+                "card_name": "L OWNER",
+                "created_at": "2025-09-21T00:00:00+00:00",
+            }
+        )
+        assert db.list_owners() == []
+
+        assert db.backfill_index_keys() == 1
+
+        assert [owner.name for owner in db.list_owners()] == ["Legacy"]
@@ -57,6 +57,17 @@ class TestCategory:
         assert category.get_pk() == "CATEGORY#TestCategory"
         assert category.get_sk() == "CATEGORY#TestCategory"
 
+    def test_category_normalized_values_follow_updates(self, sample_category_data):
+        """Test normalized labels and card name reflect copies and assignments."""
+        category = Category(**sample_category_data)
+        assert category.normalized_labels == ("test", "sample")
+
+        updated = category.model_copy(update={"labels": ["Coffee Shop!"]})
+        assert updated.normalized_labels == ("coffee shop",)
+
+        category.card_name = "J-Doe"
+        assert category.normalized_card_name == "j doe"
+
 
 class TestExpense:
     def test_create_valid_expense(self, sample_expense_data):
@@ -290,3 +290,53 @@ class TestReportExpenseSorting:
         assert expenses[0].description == "Newest Expense"  # Sept 20
         assert expenses[1].description == "Middle Expense"  # Sept 15
         assert expenses[2].description == "Oldest Expense"  # Sept 10
+
+    def test_report_expenses_keep_statement_details(self, clean_db):
+        """Test report expenses carry the same fields as listed expenses."""
+        db.create_owner(OwnerCreate(name="TestOwner", card_name="T Owner"))
+        db.create_account(
+            AccountCreate(
+                account_name="Test Account",
+                bank_name="Test Bank",
+                owner_name="TestOwner",
+                card_member="T Owner",
+            )
+        )
+        db.create_category(
+            CategoryCreate(
+                name="TestCategory",
+                labels=["test"],
+                account_id="Test Account TestOwner",
+                card_name="T Owner",
+            )
+        )
+        db.create_expense(
+            ExpenseCreate(
+                date=datetime(2025, 9, 15),
+                description="Detailed Expense",
+                card_member="T Owner",
+                account_number="1003",
+                amount=Decimal("42.00"),
+                extended_details="Foreign Spend Amount: 23.00 USD",
+                appears_on_statement_as="DETAILED",
+                address="1 St",
+                city_state="NSW 2000",
+                zip_code="2000",
+                country="AUSTRALIA",
+                reference="REF1",
+                category="TestCategory",
+                account_id="Test Account TestOwner",
+            )
+        )
+
+        expense_filter = ExpenseFilter(
+            start_date=datetime(2025, 9, 1),
+            end_date=datetime(2025, 9, 30),
+        )
+        report = ReportsService().get_expenses_by_account_report(expense_filter)
+
+        [listed] = db.list_expenses(expense_filter)
+        [reported] = report.account_groups[0].expenses
+        assert reported.reference == "REF1"
+        assert reported.address == "1 St"
+        assert reported.model_dump() == listed.model_dump()